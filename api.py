@@ -6,30 +6,37 @@ logging, gestion d'erreurs avancée et documentation automatique.
 Version compatible avec l'interface React.
 """
 
-from flask import Flask, request, jsonify, current_app
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from werkzeug.exceptions import BadRequest, NotFound, InternalServerError, Forbidden
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
-import traceback
-from datetime import datetime
-from functools import wraps
-from typing import Dict, List, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional
 import json
 from dotenv import load_dotenv
-import requests.exceptions
-from collections import defaultdict, Counter
-from datetime import datetime, timedelta
-from dateutil import parser
-from flask import request, jsonify
-from dateutil.tz import tzutc  
+from collections import defaultdict, Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event, Lock, Thread
+
+# Sérialisation JSON accélérée (optionnelle)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import du module Jira existant
 try:
-    from script_jira import JiraManager
+    from script_jira import DONE_TRANSITION_RE, JiraManager, parse_json
 except ImportError:
     print("❌ Erreur: script_jira.py non trouvé. Assurez-vous que le fichier existe.")
     sys.exit(1)
@@ -46,7 +53,13 @@ class Config:
     JIRA_PROJECT_KEY = os.getenv('JIRA_PROJECT_KEY')
     DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    # En production multi-workers, utiliser Redis (ex: redis://localhost:6379/0 ou
+    # redis+unix:///var/run/redis/redis.sock) pour partager les compteurs entre processus
     RATE_LIMIT_STORAGE_URL = os.getenv('RATE_LIMIT_STORAGE_URL', 'memory://')
+    RATE_LIMIT_STRATEGY = os.getenv('RATE_LIMIT_STRATEGY', 'moving-window')
+    DISABLE_ACCESS_LOG = os.getenv('DISABLE_ACCESS_LOG', 'False').lower() == 'true'
+    PORT = int(os.getenv('PORT', 5000))
+    REQUIRED_JIRA_VARS = ('JIRA_URL', 'JIRA_EMAIL', 'JIRA_TOKEN', 'JIRA_PROJECT_KEY')
 
 # Configuration du logging
 def setup_logging(app: Flask) -> None:
@@ -68,14 +81,38 @@ def setup_logging(app: Flask) -> None:
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
     
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(console_handler)
+    # Les écritures (fichier, console) sont faites par un thread dédié,
+    # les requêtes se contentent de déposer les enregistrements dans une file
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    app.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     app.logger.setLevel(log_level)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Fournisseur JSON Flask basé sur orjson (sérialisation en C, UTF-8 sans échappement)"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        # Corps en bytes directement, sans aller-retour str -> encodage UTF-8 de jsonify
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype=self.mimetype)
+
 def create_app(config_class=Config) -> Flask:
     """Factory pour créer l'application Flask"""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     
     CORS(app, origins=["http://localhost:3000", "http://127.0.0.1:3000"])
     
@@ -83,7 +120,10 @@ def create_app(config_class=Config) -> Flask:
         key_func=get_remote_address,
         app=app,
         default_limits=["200 per day", "50 per hour"],
-        storage_uri=app.config['RATE_LIMIT_STORAGE_URL']
+        storage_uri=app.config['RATE_LIMIT_STORAGE_URL'],
+        strategy=app.config['RATE_LIMIT_STRATEGY'],
+        # Si Redis est indisponible, limiter en mémoire plutôt que de renvoyer des 500
+        in_memory_fallback_enabled=not app.config['RATE_LIMIT_STORAGE_URL'].startswith('memory://')
     )
     
     setup_logging(app)
@@ -94,15 +134,50 @@ app, limiter = create_app()
 
 # Validation des variables d'environnement
 def validate_environment():
-    """Valide que toutes les variables d'environnement nécessaires sont présentes"""
-    required_vars = ['JIRA_URL', 'JIRA_EMAIL', 'JIRA_TOKEN', 'JIRA_PROJECT_KEY']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    """Valide que toutes les variables d'environnement nécessaires sont présentes (lues une seule fois dans Config)"""
+    missing_vars = [var for var in app.config['REQUIRED_JIRA_VARS'] if not app.config.get(var)]
     
     if missing_vars:
         error_msg = f"Variables d'environnement manquantes: {', '.join(missing_vars)}"
         app.logger.error(error_msg)
         raise EnvironmentError(error_msg)
 
+# Cache mémoire simple avec expiration
+class TTLCache:
+    """Cache clé/valeur thread-safe dont les entrées expirent après `ttl` secondes"""
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict = {}
+        self._lock = Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+    
+    def set(self, key, value, ttl: Optional[float] = None) -> None:
+        """Enregistre une valeur; `ttl` remplace la durée par défaut pour cette entrée"""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Éviction de l'entrée la plus ancienne
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+    
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
 ISSUE_TYPE_MAPPING = {
     'tâche': 'Tâche',
     'bug': 'Bug',
@@ -110,41 +185,373 @@ ISSUE_TYPE_MAPPING = {
     'epic': 'Epic'
 }
 
+# Noms déjà traduits (cas le plus fréquent: valeur envoyée par l'interface), renvoyés tels quels
+_TRANSLATED_ISSUE_TYPES = frozenset(ISSUE_TYPE_MAPPING.values())
+
 def translate_issue_type(issue_type_name: str) -> str:
     """Traduit le nom du type de ticket si nécessaire."""
+    if not issue_type_name or issue_type_name in _TRANSLATED_ISSUE_TYPES:
+        return issue_type_name
     return ISSUE_TYPE_MAPPING.get(issue_type_name.lower(), issue_type_name)
 
 # Fonction utilitaire pour normaliser les assignés
+# Valeurs (en minuscules) désignant un ticket non assigné
+UNASSIGNED_VALUES = frozenset(('unassigned', 'non assigné', 'non-assigne'))
+
+# Peu de noms distincts: mémorisés pour les boucles par ticket (analytics, statistiques)
+@lru_cache(maxsize=1024)
 def normalize_assignee(assignee):
     """Normalise les valeurs d'assigné pour éliminer les doublons"""
-    if not assignee or assignee.lower() in ['unassigned', 'non assigné', 'non-assigne', '']:
+    if not assignee or assignee.lower() in UNASSIGNED_VALUES:
         return 'Non assigné'
     return assignee.strip()
 
-# Initialisation du gestionnaire Jira
-try:
-    validate_environment()
-    jira_manager = JiraManager()
-    app.logger.info("✅ JiraManager initialisé avec succès")
-except Exception as e:
-    app.logger.error(f"❌ Erreur d'initialisation JiraManager: {e}")
-    jira_manager = None
-
-# Fonction utilitaire pour récupérer les types de tickets valides
-def get_valid_issue_types():
-    """Récupère les types de tickets valides depuis Jira (fonction interne)"""
+# Initialisation paresseuse du gestionnaire Jira: la connexion est établie à la
+# première requête plutôt qu'à l'import, ce qui accélère le démarrage des workers
+jira_manager: Optional[JiraManager] = None
+_jira_manager_lock = Lock()
+
+def get_jira_manager() -> Optional[JiraManager]:
+    """Retourne le JiraManager partagé, en le créant au premier appel (None si échec)"""
+    global jira_manager
+    if jira_manager is None:
+        with _jira_manager_lock:
+            if jira_manager is None:
+                try:
+                    validate_environment()
+                    # L'API vérifie les identifiants dès la création pour signaler un Jira injoignable
+                    jira_manager = JiraManager(validate_connection=True)
+                    app.logger.info("✅ JiraManager initialisé avec succès")
+                except (Exception, SystemExit) as e:
+                    # JiraManager appelle sys.exit() si le test de connexion échoue
+                    app.logger.error("❌ Erreur d'initialisation JiraManager: %s", e)
+    return jira_manager
+
+# Rafraîchissements périodiques en arrière-plan (un thread démon par nom et par processus)
+_refreshers: Dict[str, Thread] = {}
+_refreshers_lock = Lock()
+
+def start_refresher(name: str, interval: float, refresh) -> None:
+    """Démarre une seule fois un thread qui appelle refresh() toutes les `interval` secondes"""
+    if name in _refreshers:
+        return
+    with _refreshers_lock:
+        if name in _refreshers:
+            return
+        
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    refresh()
+                except Exception as e:
+                    # La valeur précédente reste servie
+                    app.logger.error("Erreur rafraîchissement %s: %s", name, e)
+        
+        thread = Thread(target=loop, name=f'{name}-refresher', daemon=True)
+        _refreshers[name] = thread
+        thread.start()
+
+# Pool de threads pour les appels Jira indépendants (I/O, le GIL n'est pas limitant)
+JIRA_POOL_WORKERS = 8
+jira_pool = ThreadPoolExecutor(max_workers=JIRA_POOL_WORKERS, thread_name_prefix='jira')
+
+# Nombre maximal d'appels Jira simultanés pour les lots, toutes requêtes confondues
+# (pool partagé: borne globale des appels en vol, limite les réponses 429 de Jira)
+BATCH_FETCH_WORKERS = 5
+batch_pool = ThreadPoolExecutor(max_workers=BATCH_FETCH_WORKERS, thread_name_prefix='jira-batch')
+
+def batch_fetch(keys, fetch) -> Dict:
+    """Appelle fetch(key) en parallèle pour chaque clé et retourne {clé: résultat}"""
+    results = {}
+    futures = {batch_pool.submit(fetch, key): key for key in keys}
+    for future in as_completed(futures):
+        key = futures[future]
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            app.logger.error("Échec récupération %s: %s", key, e)
+            results[key] = None
+    return results
+
+# Nombre maximal de tickets par requête groupée (détails, transitions)
+MAX_BATCH_TICKETS = 50
+
+# Clé de ticket Jira (ex: PROJ-123): les clés sont insérées dans les chemins issue/{key}
+ISSUE_KEY_RE = re.compile(r'[A-Z][A-Z0-9_]*-\d+\Z', re.IGNORECASE)
+
+def parse_batch_keys(data: Dict):
+    """Valide le champ keys d'une requête groupée: (clés uniques, None) ou (None, réponse d'erreur 400)"""
+    keys = data['keys']
+    if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+        return None, prebuilt_response(ERROR_BATCH_KEYS_INVALID)
+    
+    keys = list(dict.fromkeys(key.strip() for key in keys if key.strip()))
+    if not all(ISSUE_KEY_RE.match(key) for key in keys):
+        return None, prebuilt_response(ERROR_BATCH_KEYS_INVALID)
+    if len(keys) > MAX_BATCH_TICKETS:
+        return None, error_response(400, f'Maximum {MAX_BATCH_TICKETS} tickets par requête')
+    return keys, None
+
+# Champs Jira nécessaires aux analytics et aux statistiques (une recherche JQL paginée au lieu d'un appel par ticket)
+ANALYTICS_FIELDS = 'status,assignee,issuetype,priority,created,resolutiondate,updated'
+JIRA_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse une date Jira ISO 8601 (ex: 2024-01-15T10:30:00.000+0000), ValueError si invalide"""
     try:
-        response = jira_manager._make_request("GET", f"project/{jira_manager.project_key}")
-        if response and response.status_code == 200:
-            issue_types = [t['name'] for t in response.json()['issueTypes'] if not t.get('subtask')]
-            app.logger.info(f"Types de tickets valides récupérés: {issue_types}")
-            return issue_types
-        else:
-            app.logger.error(f"Impossible de récupérer les types de tickets: {response.status_code if response else 'Pas de réponse'}")
-            return ['Task', 'Bug', 'Story', 'Epic']
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Avant Python 3.11, fromisoformat ne gère pas le décalage +0000
+        return datetime.strptime(value, JIRA_DATETIME_FORMAT)
+
+def fetch_analytics_tickets() -> Optional[List[Dict]]:
+    """Récupère les champs analytics de tous les tickets du projet, assigné normalisé (None en cas d'échec)"""
+    issues = jira_manager.search_issues(f"project = {jira_manager.project_key}", ANALYTICS_FIELDS)
+    if issues is None:
+        return None
+    tickets = []
+    for issue in issues:
+        fields = issue['fields']
+        tickets.append({
+            'key': issue['key'],
+            'status': fields['status']['name'],
+            'assignee': normalize_assignee(fields['assignee'].get('displayName') if fields.get('assignee') else None),
+            'issue_type': fields['issuetype']['name'] if fields.get('issuetype') else 'Unknown',
+            # Même libellé que get_tickets pour les tickets sans priorité
+            'priority': fields['priority']['name'] if fields.get('priority') else 'None',
+            'created': fields.get('created'),
+            'resolutiondate': fields.get('resolutiondate'),
+            'updated': fields.get('updated')
+        })
+    return tickets
+
+# Réponses analytics mises en cache: le tableau de bord les interroge en boucle
+ANALYTICS_CACHE_TTL = int(os.getenv('ANALYTICS_CACHE_TTL', 90))
+_analytics_cache = TTLCache(ttl=ANALYTICS_CACHE_TTL, maxsize=32)
+
+def get_cached_analytics(name: str, compute: Callable[[], Optional[Dict]], *params) -> Optional[Dict]:
+    """Retourne la réponse analytics (route, paramètres, projet) en cache, calculée si absente (None si échec)"""
+    cache_key = (name, jira_manager.project_key, *params)
+    payload = _analytics_cache.get(cache_key)
+    if payload is None:
+        payload = compute()
+        # Un échec n'est pas mis en cache: le prochain appel réessaie
+        if payload is not None:
+            _analytics_cache.set(cache_key, payload)
+    return payload
+
+_analytics_tickets_lock = Lock()
+
+def get_analytics_tickets() -> Optional[List[Dict]]:
+    """Lignes partagées par /api/stats et les routes analytics: une seule recherche Jira par ANALYTICS_CACHE_TTL (None si échec)"""
+    cache_key = ('tickets', jira_manager.project_key)
+    # Le verrou évite que les appels simultanés du tableau de bord lancent chacun la recherche
+    with _analytics_tickets_lock:
+        tickets = _analytics_cache.get(cache_key)
+        if tickets is None:
+            tickets = fetch_analytics_tickets()
+            if tickets is not None:
+                _analytics_cache.set(cache_key, tickets)
+    return tickets
+
+# Cache des types de tickets valides, par projet (la liste change très rarement).
+# C'est le seul cache des types côté API: la lecture passe directement par _make_request et
+# create_ticket est appelé avec validate_issue_type=False, le cache du JiraManager reste vide.
+ISSUE_TYPES_CACHE_TTL = 600
+DEFAULT_ISSUE_TYPES = ['Task', 'Bug', 'Story', 'Epic']
+_DEFAULT_ISSUE_TYPES_ENTRY = (DEFAULT_ISSUE_TYPES, {t.lower(): t for t in DEFAULT_ISSUE_TYPES})
+_issue_types_cache = TTLCache(ttl=ISSUE_TYPES_CACHE_TTL, maxsize=4)
+
+def _fetch_valid_issue_types() -> tuple:
+    """Récupère les types de tickets valides depuis Jira: (types, None) ou, en cas d'échec, (None, réponse Jira ou None si injoignable)"""
+    response = jira_manager._make_request("GET", f"project/{jira_manager.project_key}")
+    if response is None or response.status_code != 200:
+        app.logger.error("Impossible de récupérer les types de tickets: %s", response.status_code if response is not None else 'Pas de réponse')
+        return None, response
+    issue_types = [t['name'] for t in parse_json(response)['issueTypes'] if not t.get('subtask')]
+    app.logger.info("Types de tickets valides récupérés: %s", issue_types)
+    return issue_types, None
+
+def _get_issue_types_entry(use_default: bool = True) -> tuple:
+    """Retourne ((types, {type en minuscules: type}), None) depuis le cache, en le remplissant si expiré.
+    En cas d'échec: la liste par défaut si use_default, sinon (None, réponse Jira en échec ou None si injoignable)"""
+    project_key = jira_manager.project_key
+    entry = _issue_types_cache.get(project_key)
+    if entry:
+        return entry, None
+    
+    try:
+        issue_types, failed = _fetch_valid_issue_types()
     except Exception as e:
-        app.logger.error(f"Erreur lors de la récupération des types: {str(e)}")
-        return ['Task', 'Bug', 'Story', 'Epic']
+        if not use_default:
+            raise
+        app.logger.error("Erreur lors de la récupération des types: %s", e)
+        issue_types, failed = None, None
+    if issue_types is None:
+        # Ne pas mettre en cache la liste par défaut pour réessayer au prochain appel
+        return (_DEFAULT_ISSUE_TYPES_ENTRY if use_default else None), failed
+    
+    return store_issue_types(project_key, issue_types), None
+
+def store_issue_types(project_key: str, issue_types: List[str]) -> tuple:
+    """Met en cache la liste des types d'un projet avec sa table de correspondance en minuscules"""
+    entry = (issue_types, {t.lower(): t for t in issue_types})
+    _issue_types_cache.set(project_key, entry)
+    return entry
+
+def get_valid_issue_types() -> List[str]:
+    """Récupère les types de tickets valides (mis en cache pendant ISSUE_TYPES_CACHE_TTL secondes)"""
+    return _get_issue_types_entry()[0][0]
+
+def match_issue_type(issue_type: str) -> Optional[str]:
+    """Retourne le nom exact du type de ticket Jira correspondant (insensible à la casse), ou None"""
+    return _get_issue_types_entry()[0][1].get(issue_type.lower())
+
+def invalidate_issue_types_cache() -> None:
+    """Vide le cache des types de tickets"""
+    _issue_types_cache.clear()
+
+# Cache de courte durée des tickets pour absorber les requêtes simultanées de l'interface
+# (liste, filtres et analytics au chargement du tableau de bord)
+TICKETS_CACHE_TTL = int(os.getenv('TICKETS_CACHE_TTL', 10))
+_tickets_cache = TTLCache(ttl=TICKETS_CACHE_TTL, maxsize=32)
+# Recherches en cours par clause JQL: [terminée, résultat]. Seuls les appels pour la même
+# clause attendent la première recherche; _tickets_lock ne protège que ce dictionnaire.
+_tickets_inflight: Dict[str, list] = {}
+_tickets_lock = Lock()
+
+# La liste complète est rechargée et pré-parsée en arrière-plan après le premier appel;
+# son entrée de cache vit jusqu'au rafraîchissement suivant (ou une modification)
+TICKETS_REFRESH_INTERVAL = int(os.getenv('TICKETS_REFRESH_INTERVAL', 30))
+_ALL_TICKETS_TTL = TICKETS_REFRESH_INTERVAL + TICKETS_CACHE_TTL
+# Incrémenté à chaque invalidation: un chargement commencé avant une modification n'est pas mis en cache
+_tickets_generation = [0]
+
+def refresh_tickets() -> None:
+    """Recharge la liste complète des tickets et parse les chaînes hors du chemin des requêtes"""
+    generation = _tickets_generation[0]
+    tickets = jira_manager.search_tickets('')
+    if tickets:
+        for ticket_list in tickets.values():
+            for ticket_string in ticket_list:
+                parse_ticket_info(ticket_string)
+        if generation == _tickets_generation[0]:
+            _tickets_cache.set('', tickets, ttl=_ALL_TICKETS_TTL)
+
+def get_cached_tickets(jql_filter: str = '') -> Dict[str, List[str]]:
+    """Retourne les tickets (restreints par la clause JQL éventuelle), partagés entre les requêtes"""
+    tickets = _tickets_cache.get(jql_filter)
+    if tickets is None:
+        # Les appels concurrents pour la même clause partagent une seule requête Jira
+        with _tickets_lock:
+            flight = _tickets_inflight.get(jql_filter)
+            leader = flight is None
+            if leader:
+                flight = _tickets_inflight[jql_filter] = [Event(), None]
+        if leader:
+            try:
+                generation = _tickets_generation[0]
+                tickets = jira_manager.search_tickets(jql_filter)
+                if tickets and generation == _tickets_generation[0]:
+                    _tickets_cache.set(jql_filter, tickets, ttl=None if jql_filter else _ALL_TICKETS_TTL)
+                flight[1] = tickets
+            finally:
+                with _tickets_lock:
+                    del _tickets_inflight[jql_filter]
+                flight[0].set()
+        else:
+            flight[0].wait()
+            tickets = flight[1]
+    if not jql_filter:
+        start_refresher('tickets', TICKETS_REFRESH_INTERVAL, refresh_tickets)
+    return tickets or {}
+
+def invalidate_tickets_cache() -> None:
+    """Vide le cache des tickets (à appeler après chaque modification)"""
+    _tickets_generation[0] += 1
+    _tickets_cache.clear()
+    _analytics_cache.clear()
+    # /api/stats recalcule au prochain appel au lieu de servir l'instantané d'avant la modification
+    _stats_snapshot['data'] = None
+
+# Statuts du projet (colonnes du tableau), stables comme les types de tickets
+_statuses_cache = TTLCache(ttl=ISSUE_TYPES_CACHE_TTL, maxsize=4)
+
+def get_project_statuses() -> List[str]:
+    """Retourne les noms des statuts du projet, depuis le cache si possible"""
+    statuses = _statuses_cache.get(jira_manager.project_key)
+    if statuses is None:
+        statuses = jira_manager.get_statuses()
+        if statuses:
+            _statuses_cache.set(jira_manager.project_key, statuses)
+    return statuses
+
+def jql_quote(value: str) -> str:
+    """Encadre une valeur de guillemets pour JQL en échappant \\ et \""""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def build_jql_filter(status: Optional[str], issue_type: Optional[str], priority: Optional[str]) -> str:
+    """Traduit les filtres actifs statut/type/priorité en clause JQL ('' si aucun filtre)"""
+    clauses = []
+    if status:
+        clauses.append(f'status = {jql_quote(status)}')
+    if issue_type:
+        clauses.append(f'issuetype = {jql_quote(issue_type)}')
+    if priority:
+        # get_tickets affiche "None" pour les tickets sans priorité
+        clauses.append('priority is EMPTY' if priority == 'none' else f'priority = {jql_quote(priority)}')
+    return ' AND '.join(clauses)
+
+# Transitions disponibles par ticket, conservées brièvement (ouverture répétée de la modale)
+TRANSITIONS_CACHE_TTL = 30
+_transitions_cache = TTLCache(ttl=TRANSITIONS_CACHE_TTL, maxsize=512)
+
+def get_cached_transitions(ticket_key: str) -> Optional[Dict[str, str]]:
+    """Retourne les transitions disponibles d'un ticket, depuis le cache si possible"""
+    transitions = _transitions_cache.get(ticket_key)
+    if transitions is None:
+        transitions = jira_manager.get_available_transitions(ticket_key)
+        if transitions:
+            _transitions_cache.set(ticket_key, transitions)
+    return transitions
+
+# Cache des résolutions d'utilisateurs (accountId ou _NOT_FOUND pour les recherches sans résultat)
+ACCOUNT_ID_CACHE_TTL = 900
+# Les recherches sans résultat expirent plus vite (utilisateur créé entre-temps)
+ACCOUNT_ID_NEGATIVE_TTL = 60
+_NOT_FOUND = object()
+_account_id_cache = TTLCache(ttl=ACCOUNT_ID_CACHE_TTL, maxsize=1024)
+_account_id_cache_stats = Counter()
+
+def _resolve_account_id(assignee: str) -> Optional[str]:
+    """Recherche l'accountId d'un utilisateur Jira, avec mise en cache des résultats positifs et négatifs"""
+    # La recherche d'utilisateurs Jira est insensible à la casse
+    cache_key = assignee.strip().lower()
+    cached = _account_id_cache.get(cache_key)
+    if cached is not None:
+        _account_id_cache_stats['hit'] += 1
+        return None if cached is _NOT_FOUND else cached
+    _account_id_cache_stats['miss'] += 1
+    
+    response = jira_manager._make_request("GET", "user/search", params={'query': assignee})
+    if response and response.status_code == 200:
+        users = parse_json(response)
+        account_id = users[0].get('accountId') if users else None
+        if not account_id:
+            app.logger.warning("Aucun utilisateur trouvé pour query: %s", assignee)
+        if account_id:
+            _account_id_cache.set(cache_key, account_id)
+        else:
+            _account_id_cache.set(cache_key, _NOT_FOUND, ttl=ACCOUNT_ID_NEGATIVE_TTL)
+        app.logger.debug("Cache utilisateurs - hits: %s, misses: %s", _account_id_cache_stats['hit'], _account_id_cache_stats['miss'])
+        return account_id
+    # Les erreurs réseau/serveur ne sont pas mises en cache
+    app.logger.error("Échec recherche utilisateur pour %s: %s", assignee, response.status_code if response is not None else 'N/A')
+    return None
+
+# accountId Jira: plus de 20 caractères alphanumériques, ':' ou '-'
+ACCOUNT_ID_RE = re.compile(r'(?:[^\W_]|[:-]){21,}\Z')
 
 # Fonction utilitaire pour valider l'accountId
 def validate_account_id(assignee: str) -> Optional[str]:
@@ -158,50 +565,112 @@ def validate_account_id(assignee: str) -> Optional[str]:
         return None
     
     # Si c'est déjà un accountId (format long avec caractères alphanumériques et certains caractères spéciaux)
-    if len(assignee) > 20 and all(c.isalnum() or c in [':', '-'] for c in assignee):
+    if ACCOUNT_ID_RE.match(assignee):
         return assignee
     
     # Rechercher l'utilisateur
-    response = jira_manager._make_request("GET", f"user/search?query={assignee}")
-    if response and response.status_code == 200:
-        users = response.json()
-        if users:
-            return users[0].get('accountId')
-        app.logger.warning(f"Aucun utilisateur trouvé pour query: {assignee}")
-        return None
-    app.logger.error(f"Échec recherche utilisateur pour {assignee}: {response.status_code if response else 'N/A'}")
-    return None
+    return _resolve_account_id(assignee)
+
+# Réponses d'erreur constantes: corps JSON sérialisés une seule fois à l'import.
+# Un nouvel objet Response est créé à chaque fois car Flask/CORS modifient ses en-têtes.
+def _error_payload(error: str, message: Optional[str] = None) -> Dict:
+    payload = {'success': False, 'error': error}
+    if message is not None:
+        payload['message'] = message
+    return payload
+
+def _prebuilt_error(status: int, error: str, message: Optional[str] = None) -> tuple:
+    return json.dumps(_error_payload(error, message), ensure_ascii=False).encode('utf-8'), status
+
+ERROR_CONTENT_TYPE = _prebuilt_error(400, 'Content-Type doit être application/json')
+ERROR_INVALID_JSON = _prebuilt_error(400, 'JSON invalide ou manquant')
+ERROR_JIRA_UNAVAILABLE = _prebuilt_error(503, 'Service Jira non disponible', 'La connexion à Jira n\'a pas pu être établie')
+ERROR_FORBIDDEN = _prebuilt_error(403, 'Permission refusée', 'Vous n\'avez pas les permissions nécessaires pour cette opération')
+ERROR_RATE_LIMITED = _prebuilt_error(429, 'Trop de requêtes', 'Limite de taux dépassée, veuillez réessayer plus tard')
+ERROR_INTERNAL = _prebuilt_error(500, 'Erreur interne du serveur', 'Une erreur inattendue s\'est produite')
+ERROR_TICKET_KEY_REQUIRED = _prebuilt_error(400, 'Clé du ticket requise')
+ERROR_SUMMARY_TOO_SHORT = _prebuilt_error(400, 'Le résumé doit contenir au moins 5 caractères')
+ERROR_SUMMARY_TOO_LONG = _prebuilt_error(400, 'Le résumé ne peut pas dépasser 255 caractères')
+ERROR_USER_QUERY_REQUIRED = _prebuilt_error(400, 'Requête de recherche requise', 'Veuillez fournir un email ou un nom d\'utilisateur via le paramètre query')
+ERROR_CREATE_FAILED = _prebuilt_error(400, 'Échec de la création du ticket', 'Vérifiez les paramètres et permissions')
+ERROR_NO_UPDATE_FIELDS = _prebuilt_error(400, 'Au moins un champ doit être fourni pour la mise à jour')
+ERROR_UPDATE_FAILED = _prebuilt_error(400, 'Échec de la mise à jour du ticket', 'Vérifiez les valeurs fournies et les permissions')
+ERROR_TRANSITIONS_NOT_FOUND = _prebuilt_error(404, 'Impossible de récupérer les transitions', 'Vérifiez que le ticket existe')
+ERROR_TRANSITION_NAME_REQUIRED = _prebuilt_error(400, 'Nom de la transition requis')
+ERROR_TRANSITION_FAILED = _prebuilt_error(400, 'Échec de la transition du ticket', 'Erreurs: Transition échouée')
+ERROR_BATCH_KEYS_INVALID = _prebuilt_error(400, 'Le champ keys doit être une liste de clés de tickets')
+
+def _forbidden(message: str) -> tuple:
+    return _prebuilt_error(403, 'Permission refusée', message)
+
+def _jira_unreachable(error: str) -> tuple:
+    return _prebuilt_error(500, error, 'Erreur réseau ou serveur Jira inaccessible')
+
+ERROR_FORBIDDEN_USER_SEARCH = _forbidden('Vous n\'avez pas la permission de rechercher des utilisateurs')
+ERROR_FORBIDDEN_TICKETS = _forbidden('Vous n\'avez pas les permissions nécessaires pour accéder aux tickets')
+ERROR_FORBIDDEN_TICKET = _forbidden('Vous n\'avez pas la permission d\'accéder à ce ticket')
+ERROR_FORBIDDEN_TRANSITIONS = _forbidden('Vous n\'avez pas les permissions nécessaires pour accéder aux transitions')
+ERROR_FORBIDDEN_DELETE = _forbidden('Vous n\'avez pas la permission de supprimer ce ticket')
+
+ERROR_USER_SEARCH_UNREACHABLE = _jira_unreachable('Échec de la recherche d\'utilisateurs')
+ERROR_PRIORITIES_UNREACHABLE = _jira_unreachable('Échec récupération priorités')
+ERROR_DETAILS_UNREACHABLE = _jira_unreachable('Impossible de récupérer les détails')
+ERROR_ISSUE_TYPES_UNREACHABLE = _jira_unreachable('Échec récupération types de tickets')
+ERROR_DELETE_UNREACHABLE = _jira_unreachable('Échec de la suppression du ticket')
+
+def prebuilt_response(prebuilt: tuple) -> Response:
+    """Construit la réponse HTTP d'une erreur pré-sérialisée"""
+    body, status = prebuilt
+    return Response(body, status=status, mimetype='application/json')
+
+def error_response(status: int, error: str, message: Optional[str] = None) -> tuple:
+    """Réponse d'erreur JSON au contenu variable (message d'exception, clé de ticket...)"""
+    return jsonify(_error_payload(error, message)), status
+
+def conditional_jsonify(payload, max_age: Optional[int] = None) -> Response:
+    """Réponse JSON avec ETag faible; renvoie 304 si le client envoie un If-None-Match correspondant"""
+    response = jsonify(payload)
+    response.add_etag(weak=True)
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response.make_conditional(request)
 
 # Décorateurs utilitaires
 def validate_jira_connection(f):
     """Décorateur pour vérifier la connexion Jira"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not jira_manager:
+        if not get_jira_manager():
             app.logger.error("JiraManager non initialisé")
-            return jsonify({
-                'success': False,
-                'error': 'Service Jira non disponible',
-                'message': 'La connexion à Jira n\'a pas pu être établie'
-            }), 503
+            return prebuilt_response(ERROR_JIRA_UNAVAILABLE)
         return f(*args, **kwargs)
     return decorated_function
 
 def log_request(f):
-    """Décorateur pour logger les requêtes"""
+    """Décorateur pour logger les requêtes (désactivé si DISABLE_ACCESS_LOG)"""
+    if app.config['DISABLE_ACCESS_LOG']:
+        return f
+    
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        start_time = datetime.now()
-        app.logger.info(f"🚀 {request.method} {request.path} - IP: {request.remote_addr}")
+        # Si INFO est filtré, on évite aussi les accès au proxy `request` pour le log
+        if not app.logger.isEnabledFor(logging.INFO):
+            return f(*args, **kwargs)
+        
+        # Méthode et chemin lus une seule fois sur le proxy `request`
+        method, path = request.method, request.path
+        start_time = time.perf_counter()
+        app.logger.info("🚀 %s %s - IP: %s", method, path, request.remote_addr)
         
         try:
             result = f(*args, **kwargs)
-            duration = (datetime.now() - start_time).total_seconds()
-            app.logger.info(f"✅ {request.method} {request.path} - {duration:.3f}s")
+            duration = time.perf_counter() - start_time
+            app.logger.info("✅ %s %s - %.3fs", method, path, duration)
             return result
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            app.logger.error(f"❌ {request.method} {request.path} - {duration:.3f}s - Error: {str(e)}")
+            duration = time.perf_counter() - start_time
+            app.logger.error("❌ %s %s - %.3fs - Error: %s", method, path, duration, e)
             raise
     
     return decorated_function
@@ -212,124 +681,148 @@ def validate_json(required_fields: List[str] = None, optional_fields: List[str]
         @wraps(f)
         def decorated_function(*args, **kwargs):
             if not request.is_json:
-                return jsonify({
-                    'success': False,
-                    'error': 'Content-Type doit être application/json'
-                }), 400
+                return prebuilt_response(ERROR_CONTENT_TYPE)
             
             data = request.get_json(silent=True)
             if data is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'JSON invalide ou manquant'
-                }), 400
+                return prebuilt_response(ERROR_INVALID_JSON)
             
             if required_fields:
                 missing_fields = [field for field in required_fields if not data.get(field)]
                 if missing_fields:
-                    return jsonify({
-                        'success': False,
-                        'error': f'Champs requis manquants: {", ".join(missing_fields)}'
-                    }), 400
+                    return error_response(400, f'Champs requis manquants: {", ".join(missing_fields)}')
             
             return f(data, *args, **kwargs)
         return decorated_function
     return decorator
 
-# Fonction utilitaire pour parser les informations des tickets depuis le format string
-def parse_ticket_info(ticket_string):
+def validate_ticket_key(f):
+    """Décorateur pour valider la clé du ticket de l'URL (transmise sans espaces)"""
+    @wraps(f)
+    def decorated_function(*args, ticket_key, **kwargs):
+        ticket_key = ticket_key.strip()
+        if not ticket_key:
+            return prebuilt_response(ERROR_TICKET_KEY_REQUIRED)
+        return f(*args, ticket_key=ticket_key, **kwargs)
+    return decorated_function
+
+# Format produit par JiraManager.get_tickets: "KEY: SUMMARY [ASSIGNEE] [TYPE] [PRIORITY]"
+TICKET_STRING_RE = re.compile(
+    r'^(?P<key>[^:]+):\s*(?P<summary>.*?)\s*\[(?P<assignee>[^\]]+)\]\s*\[(?P<issue_type>[^\]]+)\]\s*\[(?P<priority>[^\]]+)\]\s*$'
+)
+
+# Ticket parsé (tuple léger: moins de mémoire et accès plus rapide qu'un dict par ticket)
+ParsedTicket = namedtuple('ParsedTicket', 'key summary assignee issue_type priority')
+
+# Fonction utilitaire pour parser les informations des tickets depuis le format string.
+# Mémoïsée: les mêmes chaînes reviennent à chaque requête (liste, filtres, analytics)
+# tant que le ticket n'est pas modifié; un ticket modifié produit une nouvelle chaîne.
+@lru_cache(maxsize=4096)
+def parse_ticket_info(ticket_string) -> Optional[ParsedTicket]:
     """Parse les informations d'un ticket depuis le format string avec normalisation des assignés"""
-    try:
-        # Format attendu: "KEY: SUMMARY [ASSIGNEE] [TYPE] [PRIORITY]"
-        parts = ticket_string.split(': ', 1)
-        if len(parts) < 2:
-            return None
-        
-        key = parts[0].strip()
-        rest = parts[1]
-        
-        # Extraire les parties entre crochets
-        import re
-        bracket_matches = re.findall(r'\[([^\]]+)\]', rest)
-        
-        if len(bracket_matches) >= 3:  # Au moins assignee, type et priority
-            assignee_raw = bracket_matches[0]
-            assignee = normalize_assignee(assignee_raw)
-            issue_type = bracket_matches[1]
-            priority = bracket_matches[2]
-            
-            # Extraire le summary (tout avant le premier crochet)
-            summary_match = re.match(r'^(.+?)\s*\[', rest)
-            summary = summary_match.group(1).strip() if summary_match else rest.strip()
-            
-            return {
-                'key': key,
-                'summary': summary,
-                'assignee': assignee,
-                'issue_type': issue_type,
-                'priority': priority
-            }
-    except Exception as e:
-        app.logger.error(f"Erreur parsing ticket: {e}")
+    match = TICKET_STRING_RE.match(ticket_string)
+    if not match:
+        return None
     
-    return None
+    key, summary, assignee, issue_type, priority = match.groups()
+    return ParsedTicket(key.strip(), summary, normalize_assignee(assignee), issue_type, priority)
+
+def active_filter_value(value: str) -> Optional[str]:
+    """Retourne la valeur de filtre en minuscules, ou None si le filtre est inactif ('all' ou vide)"""
+    value = value.lower()
+    return None if value in ('all', '') else value
+
+def build_ticket_predicate(assignee_filter: str, type_filter: str, priority_filter: str):
+    """Compose une seule fois les filtres assigné/type/priorité en un prédicat sur ParsedTicket"""
+    checks = []
+    if active_filter_value(assignee_filter):
+        assignee = normalize_assignee(assignee_filter)
+        checks.append(lambda t: t.assignee == assignee)
+    issue_type = active_filter_value(type_filter)
+    if issue_type:
+        checks.append(lambda t: t.issue_type.lower() == issue_type)
+    priority = active_filter_value(priority_filter)
+    if priority:
+        checks.append(lambda t: t.priority.lower() == priority)
+    
+    if not checks:
+        return lambda t: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda t: all(check(t) for check in checks)
+
+# Fonction utilitaire pour extraire le texte d'une description ADF (Atlassian Document Format)
+def adf_to_text(description) -> str:
+    """Concatène les nœuds texte des paragraphes ADF, une ligne par nœud"""
+    if isinstance(description, str):
+        return description.strip()
+    if not isinstance(description, dict):
+        return ''
+    return '\n'.join(
+        node['text']
+        for para in description.get('content') or ()
+        for node in para.get('content') or ()
+        if node.get('type') == 'text' and node.get('text')
+    ).strip()
 
 # Gestionnaires d'erreurs globaux
 @app.errorhandler(400)
 def bad_request(error):
-    app.logger.warning(f"Requête incorrecte: {error}")
-    return jsonify({
-        'success': False,
-        'error': 'Requête incorrecte',
-        'message': str(error.description) if hasattr(error, 'description') else 'Données invalides'
-    }), 400
+    app.logger.warning("Requête incorrecte: %s", error)
+    return error_response(400, 'Requête incorrecte', str(error.description) if hasattr(error, 'description') else 'Données invalides')
 
 @app.errorhandler(404)
 def not_found(error):
-    app.logger.warning(f"Ressource non trouvée: {request.path}")
-    return jsonify({
-        'success': False,
-        'error': 'Ressource non trouvée',
-        'message': f'L\'endpoint {request.path} n\'existe pas'
-    }), 404
+    app.logger.warning("Ressource non trouvée: %s", request.path)
+    return error_response(404, 'Ressource non trouvée', f'L\'endpoint {request.path} n\'existe pas')
 
 @app.errorhandler(403)
 def forbidden(error):
-    app.logger.warning(f"Permission refusée: {request.path}")
-    return jsonify({
-        'success': False,
-        'error': 'Permission refusée',
-        'message': 'Vous n\'avez pas les permissions nécessaires pour cette opération'
-    }), 403
+    app.logger.warning("Permission refusée: %s", request.path)
+    return prebuilt_response(ERROR_FORBIDDEN)
 
 @app.errorhandler(429)
 def ratelimit_handler(e):
-    app.logger.warning(f"Rate limit dépassé: {request.remote_addr}")
-    return jsonify({
-        'success': False,
-        'error': 'Trop de requêtes',
-        'message': 'Limite de taux dépassée, veuillez réessayer plus tard'
-    }), 429
+    app.logger.warning("Rate limit dépassé: %s", request.remote_addr)
+    return prebuilt_response(ERROR_RATE_LIMITED)
 
 @app.errorhandler(500)
 def internal_error(error):
-    app.logger.error(f"Erreur interne: {error}")
-    app.logger.error(traceback.format_exc())
-    return jsonify({
-        'success': False,
-        'error': 'Erreur interne du serveur',
-        'message': 'Une erreur inattendue s\'est produite'
-    }), 500
+    app.logger.error("Erreur interne: %s", error, exc_info=True)
+    return prebuilt_response(ERROR_INTERNAL)
+
+# Horodatage ISO partagé, recalculé au plus toutes les 200 ms
+_timestamp_cache = [0.0, '']
+
+def now_iso() -> str:
+    """Retourne l'horodatage courant au format ISO (précision ~200 ms)"""
+    now = time.time()
+    if now - _timestamp_cache[0] > 0.2:
+        _timestamp_cache[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _timestamp_cache[1]
+
+# Résultat du test de connexion Jira, conservé quelques secondes pour les sondes de santé
+HEALTH_CHECK_CACHE_TTL = 5
+_jira_status_cache = TTLCache(ttl=HEALTH_CHECK_CACHE_TTL, maxsize=1)
+
+def get_jira_status() -> str:
+    """Retourne l'état de la connexion Jira sans interroger Jira à chaque sonde"""
+    jira_status = _jira_status_cache.get('status')
+    if jira_status is None:
+        manager = get_jira_manager()
+        jira_status = "connected" if manager and manager._test_connection() else "disconnected"
+        _jira_status_cache.set('status', jira_status)
+    return jira_status
 
 # Routes API
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Vérification de l'état de santé de l'API"""
     try:
-        jira_status = "connected" if jira_manager and jira_manager._test_connection() else "disconnected"
+        jira_status = get_jira_status()
         return jsonify({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'jira_connection': jira_status,
             'version': '2.5.6'
         }), 200
@@ -337,7 +830,7 @@ def health_check():
         return jsonify({
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         }), 503
 
 @app.route('/api/users', methods=['GET'])
@@ -349,26 +842,18 @@ def search_users():
     try:
         query = request.args.get('query', '').strip()
         if not query:
-            return jsonify({
-                'success': False,
-                'error': 'Requête de recherche requise',
-                'message': 'Veuillez fournir un email ou un nom d\'utilisateur via le paramètre query'
-            }), 400
+            return prebuilt_response(ERROR_USER_QUERY_REQUIRED)
         
-        app.logger.info(f"Recherche utilisateurs avec query: '{query}'")
+        app.logger.info("Recherche utilisateurs avec query: '%s'", query)
         
-        response = jira_manager._make_request("GET", f"user/search?query={query}")
+        response = jira_manager._make_request("GET", "user/search", params={'query': query})
         
-        if not response:
+        if response is None:
             app.logger.error("Échec recherche utilisateurs: aucune réponse")
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la recherche d\'utilisateurs',
-                'message': 'Erreur réseau ou serveur Jira inaccessible'
-            }), 500
+            return prebuilt_response(ERROR_USER_SEARCH_UNREACHABLE)
             
         if response.status_code == 200:
-            users = response.json()
+            users = parse_json(response)
             filtered_users = [
                 {
                     'accountId': user['accountId'],
@@ -376,32 +861,23 @@ def search_users():
                     'emailAddress': user.get('emailAddress', '')
                 } for user in users
             ]
-            app.logger.info(f"Utilisateurs trouvés: {len(filtered_users)}")
-            return jsonify({
+            app.logger.info("Utilisateurs trouvés: %s", len(filtered_users))
+            return conditional_jsonify({
                 'success': True,
                 'users': filtered_users
-            }), 200
+            })
         else:
-            app.logger.warning(f"Échec recherche utilisateurs: {response.status_code} - {response.text}")
+            app.logger.warning("Échec recherche utilisateurs: %s - %s", response.status_code, response.text)
             if response.status_code == 403:
-                return jsonify({
-                    'success': False,
-                    'error': 'Permission refusée',
-                    'message': 'Vous n\'avez pas la permission de rechercher des utilisateurs'
-                }), 403
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la recherche d\'utilisateurs',
-                'message': response.text
-            }), response.status_code
+                return prebuilt_response(ERROR_FORBIDDEN_USER_SEARCH)
+            return error_response(response.status_code, 'Échec de la recherche d\'utilisateurs', response.text)
             
     except Exception as e:
-        app.logger.error(f"Erreur recherche utilisateurs: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la recherche d\'utilisateurs',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur recherche utilisateurs: %s", e)
+        return error_response(500, 'Erreur lors de la recherche d\'utilisateurs', str(e))
+
+# Les priorités Jira changent très rarement: le navigateur peut les garder 5 minutes
+PRIORITIES_MAX_AGE = 300
 
 @app.route('/api/priorities', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -411,33 +887,21 @@ def get_priorities():
     """Liste les priorités disponibles dans Jira"""
     try:
         response = jira_manager._make_request("GET", "priority")
-        if not response:
+        if response is None:
             app.logger.error("Échec récupération priorités: aucune réponse")
-            return jsonify({
-                'success': False,
-                'error': 'Échec récupération priorités',
-                'message': 'Erreur réseau ou serveur Jira inaccessible'
-            }), 500
+            return prebuilt_response(ERROR_PRIORITIES_UNREACHABLE)
         if response.status_code == 200:
-            priorities = [p['name'] for p in response.json()]
-            app.logger.info(f"Priorités récupérées: {priorities}")
-            return jsonify({
+            priorities = [p['name'] for p in parse_json(response)]
+            app.logger.info("Priorités récupérées: %s", priorities)
+            return conditional_jsonify({
                 'success': True,
                 'priorities': priorities
-            }), 200
-        app.logger.warning(f"Échec récupération priorités: {response.status_code} - {response.text}")
-        return jsonify({
-            'success': False,
-            'error': 'Échec récupération priorités',
-            'message': response.text
-        }), response.status_code
+            }, max_age=PRIORITIES_MAX_AGE)
+        app.logger.warning("Échec récupération priorités: %s - %s", response.status_code, response.text)
+        return error_response(response.status_code, 'Échec récupération priorités', response.text)
     except Exception as e:
-        app.logger.error(f"Erreur récupération priorités: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur récupération priorités',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur récupération priorités: %s", e)
+        return error_response(500, 'Erreur récupération priorités', str(e))
 
 @app.route('/api/tickets', methods=['GET'])
 @limiter.limit("30 per minute")
@@ -452,84 +916,58 @@ def list_tickets():
         status_filter = request.args.get('status', 'all').strip()
         priority_filter = request.args.get('priority', 'all').strip()
 
-        app.logger.info(f"Récupération tickets - search: '{search}', assignee: '{assignee_filter}', type: '{type_filter}', status: '{status_filter}', priority: '{priority_filter}'")
+        app.logger.info("Récupération tickets - search: '%s', assignee: '%s', type: '%s', status: '%s', priority: '%s'", search, assignee_filter, type_filter, status_filter, priority_filter)
+        
+        # Préparer les filtres une seule fois pour la requête
+        search_lower = search.lower() or None
+        status_lower = active_filter_value(status_filter)
         
-        tickets = jira_manager.get_tickets()
+        # Statut, type et priorité sont filtrés par Jira (JQL): seuls les tickets retenus sont transférés.
+        # Le filtrage local ci-dessous est conservé et garantit la même sémantique de correspondance.
+        jql_filter = build_jql_filter(status_lower, active_filter_value(type_filter), active_filter_value(priority_filter))
+        tickets = get_cached_tickets(jql_filter)
+        if jql_filter:
+            # Une colonne par statut, même vide, comme avec la liste complète
+            columns = {status: [] for status in get_project_statuses() if not status_lower or status.lower() == status_lower}
+            tickets = {**columns, **(tickets or {})}
         
         if not tickets:
             app.logger.warning("Aucun ticket récupéré depuis Jira")
             return jsonify({}), 200
         
+        ticket_matches = build_ticket_predicate(assignee_filter, type_filter, priority_filter)
+        
         filtered_tickets = {}
         
         for status, ticket_list in tickets.items():
             # Filtrage par statut
-            status_matches = (status_filter.lower() in ['all', ''] or 
-                            status_filter.upper() == status.upper())
-            
-            if not status_matches:
+            if status_lower and status_lower != status.lower():
                 continue
                 
             filtered_list = []
             
             for ticket_string in ticket_list:
-                # Parser les informations du ticket avec normalisation
-                ticket_info = parse_ticket_info(ticket_string)
-                if not ticket_info:
+                # Filtrage par recherche, avant le parsing
+                if search_lower and search_lower not in ticket_string.lower():
                     continue
                 
-                passes_all_filters = True
-                
-                # Filtrage par recherche
-                if search and search.lower() not in ticket_string.lower():
-                    passes_all_filters = False
-                
-                # Filtrage par assignee - normalisation complète
-                if passes_all_filters and assignee_filter.lower() not in ['all', '']:
-                    ticket_assignee = normalize_assignee(ticket_info['assignee'])
-                    normalized_filter = normalize_assignee(assignee_filter)
-                    
-                    if normalized_filter == 'Non assigné':
-                        if ticket_assignee != 'Non assigné':
-                            passes_all_filters = False
-                    elif ticket_assignee != normalized_filter:
-                        passes_all_filters = False
-                
-                # Filtrage par type
-                if passes_all_filters and type_filter.lower() not in ['all', '']:
-                    ticket_type = ticket_info.get('issue_type', '')
-                    if type_filter.lower() != ticket_type.lower():
-                        passes_all_filters = False
-                
-                # Filtrage par priorité
-                if passes_all_filters and priority_filter.lower() not in ['all', '']:
-                    ticket_priority = ticket_info.get('priority', '')
-                    if priority_filter.lower() != ticket_priority.lower():
-                        passes_all_filters = False
-                
-                if passes_all_filters:
+                # Parser les informations du ticket avec normalisation
+                ticket_info = parse_ticket_info(ticket_string)
+                if ticket_info and ticket_matches(ticket_info):
                     filtered_list.append(ticket_string)
             
-            if status_matches:
-                filtered_tickets[status] = filtered_list
+            filtered_tickets[status] = filtered_list
         
-        app.logger.info(f"Tickets filtrés: {sum(len(v) for v in filtered_tickets.values())} tickets dans {len(filtered_tickets)} statuts")
+        if app.logger.isEnabledFor(logging.INFO):
+            app.logger.info("Tickets filtrés: %s tickets dans %s statuts", sum(len(v) for v in filtered_tickets.values()), len(filtered_tickets))
         
-        return jsonify(filtered_tickets), 200
+        return conditional_jsonify(filtered_tickets)
         
     except Exception as e:
-        app.logger.error(f"Erreur lors de la récupération des tickets: {str(e)}")
+        app.logger.error("Erreur lors de la récupération des tickets: %s", e)
         if "permission" in str(e).lower():
-            return jsonify({
-                'success': False,
-                'error': 'Permission refusée',
-                'message': 'Vous n\'avez pas les permissions nécessaires pour accéder aux tickets'
-            }), 403
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la récupération des tickets',
-            'message': str(e)
-        }), 500
+            return prebuilt_response(ERROR_FORBIDDEN_TICKETS)
+        return error_response(500, 'Erreur lors de la récupération des tickets', str(e))
 
 @app.route('/api/filters/assignees', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -538,21 +976,20 @@ def list_tickets():
 def get_unique_assignees():
     """Récupère la liste unique des assignees pour le filtre avec normalisation"""
     try:
-        tickets = jira_manager.get_tickets()
-        assignees = set()
-        
-        for status, ticket_list in tickets.items():
-            for ticket_string in ticket_list:
-                ticket_info = parse_ticket_info(ticket_string)
-                if ticket_info:
-                    normalized_assignee = normalize_assignee(ticket_info['assignee'])
-                    assignees.add(normalized_assignee)
+        tickets = get_cached_tickets()
+        # parse_ticket_info est mémoïsé et renvoie déjà l'assigné normalisé
+        assignees = {
+            ticket_info.assignee
+            for ticket_list in tickets.values()
+            for ticket_info in map(parse_ticket_info, ticket_list) if ticket_info
+        }
         
         # Convertir en liste, trier et s'assurer que "Non assigné" est en premier si présent
-        assignee_list = sorted(list(assignees))
-        if 'Non assigné' in assignee_list:
-            assignee_list.remove('Non assigné')
-            assignee_list.insert(0, 'Non assigné')
+        if 'Non assigné' in assignees:
+            assignees.discard('Non assigné')
+            assignee_list = ['Non assigné', *sorted(assignees)]
+        else:
+            assignee_list = sorted(assignees)
         
         return jsonify({
             'success': True,
@@ -560,12 +997,8 @@ def get_unique_assignees():
         }), 200
         
     except Exception as e:
-        app.logger.error(f"Erreur récupération assignees: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur récupération assignees',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur récupération assignees: %s", e)
+        return error_response(500, 'Erreur récupération assignees', str(e))
 
 @app.route('/api/filters/types', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -574,18 +1007,14 @@ def get_unique_assignees():
 def get_unique_types():
     """Récupère la liste unique des types de tickets pour le filtre"""
     try:
-        tickets = jira_manager.get_tickets()
-        types = set()
-        
-        for status, ticket_list in tickets.items():
-            for ticket_string in ticket_list:
-                ticket_info = parse_ticket_info(ticket_string)
-                if ticket_info:
-                    issue_type = ticket_info.get('issue_type', '')
-                    if issue_type:
-                        types.add(issue_type)
+        tickets = get_cached_tickets()
+        types = {
+            ticket_info.issue_type
+            for ticket_list in tickets.values()
+            for ticket_info in map(parse_ticket_info, ticket_list) if ticket_info and ticket_info.issue_type
+        }
         
-        type_list = sorted(list(types))
+        type_list = sorted(types)
         
         return jsonify({
             'success': True,
@@ -593,12 +1022,8 @@ def get_unique_types():
         }), 200
         
     except Exception as e:
-        app.logger.error(f"Erreur récupération types: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur récupération types',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur récupération types: %s", e)
+        return error_response(500, 'Erreur récupération types', str(e))
 
 @app.route('/api/filters/statuses', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -607,7 +1032,7 @@ def get_unique_types():
 def get_unique_statuses():
     """Récupère la liste unique des statuts pour le filtre"""
     try:
-        tickets = jira_manager.get_tickets()
+        tickets = get_cached_tickets()
         statuses = list(tickets.keys()) if tickets else []
         
         return jsonify({
@@ -616,104 +1041,97 @@ def get_unique_statuses():
         }), 200
         
     except Exception as e:
-        app.logger.error(f"Erreur récupération statuses: {str(e)}")
+        app.logger.error("Erreur récupération statuses: %s", e)
+        return error_response(500, 'Erreur récupération statuses', str(e))
+
+# Champs Jira réellement utilisés par get_ticket_details (évite de transférer les champs personnalisés)
+TICKET_DETAIL_FIELDS = 'summary,description,status,assignee,priority,issuetype,created,updated,reporter,project'
+
+def build_ticket_details(issue_data: Dict, ticket_key: str) -> Dict:
+    """Construit la vue détaillée d'un ticket depuis la réponse Jira, avec l'assigné normalisé"""
+    fields = issue_data['fields']
+    assignee_raw = fields['assignee'].get('displayName') if fields.get('assignee') else None
+    
+    return {
+        'key': issue_data.get('key', ticket_key),
+        'summary': fields.get('summary', 'Sans titre'),
+        'description': adf_to_text(fields.get('description')),
+        'status': fields['status']['name'],
+        'assignee': normalize_assignee(assignee_raw),
+        'priority': fields['priority']['name'] if fields.get('priority') else 'Non définie',
+        'issueType': fields['issuetype']['name'],
+        'created': fields.get('created', ''),
+        'updated': fields.get('updated', ''),
+        'reporter': fields['reporter']['displayName'] if fields.get('reporter') else 'Inconnu',
+        'project': fields['project']['name'] if fields.get('project') else 'Inconnu'
+    }
+
+def fetch_ticket_details(ticket_key: str) -> Optional[Dict]:
+    """Récupère la vue détaillée d'un ticket, None en cas d'échec"""
+    response = jira_manager._make_request("GET", f"issue/{ticket_key}", params={'fields': TICKET_DETAIL_FIELDS})
+    if response and response.status_code == 200:
+        return build_ticket_details(parse_json(response), ticket_key)
+    return None
+
+@app.route('/api/tickets/details/batch', methods=['POST'])
+@limiter.limit("20 per minute")
+@log_request
+@validate_jira_connection
+@validate_json(required_fields=['keys'])
+def get_batch_ticket_details(data):
+    """Récupère les détails de plusieurs tickets en un seul appel (requêtes Jira en parallèle)"""
+    try:
+        keys, error = parse_batch_keys(data)
+        if error:
+            return error
+        
+        app.logger.info("Récupération détails pour %s tickets", len(keys))
+        tickets = batch_fetch(keys, fetch_ticket_details)
+        
         return jsonify({
-            'success': False,
-            'error': 'Erreur récupération statuses',
-            'message': str(e)
-        }), 500
+            'success': True,
+            'tickets': tickets
+        }), 200
+        
+    except Exception as e:
+        app.logger.error("Erreur récupération détails groupés: %s", e)
+        return error_response(500, 'Erreur lors de la récupération des détails', str(e))
 
 @app.route('/api/tickets/<ticket_key>/details', methods=['GET'])
 @limiter.limit("50 per minute")
 @log_request
 @validate_jira_connection
+@validate_ticket_key
 def get_ticket_details(ticket_key):
     """Récupère les détails complets d'un ticket avec normalisation des assignés"""
     try:
-        if not ticket_key.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Clé du ticket requise'
-            }), 400
+        app.logger.info("Récupération détails pour %s", ticket_key)
         
-        app.logger.info(f"Récupération détails pour {ticket_key}")
-        
-        response = jira_manager._make_request("GET", f"issue/{ticket_key}")
+        response = jira_manager._make_request("GET", f"issue/{ticket_key}", params={'fields': TICKET_DETAIL_FIELDS})
         
         if response and response.status_code == 200:
-            issue_data = response.json()
-            
-            # Parser la description ADF
-            description_content = ''
-            if issue_data['fields'].get('description'):
-                desc = issue_data['fields']['description']
-                if isinstance(desc, dict) and desc.get('content'):
-                    for para in desc['content']:
-                        if para.get('content'):
-                            for text in para['content']:
-                                if text.get('type') == 'text' and text.get('text'):
-                                    description_content += text['text'] + '\n'
-                elif isinstance(desc, str):
-                    description_content = desc
-            
-            # Normaliser l'assigné
-            assignee_raw = None
-            if issue_data['fields'].get('assignee'):
-                assignee_raw = issue_data['fields']['assignee'].get('displayName')
-            assignee_normalized = normalize_assignee(assignee_raw)
+            ticket_details = build_ticket_details(parse_json(response), ticket_key)
+            assignee_normalized = ticket_details['assignee']
             
-            ticket_details = {
-                'key': issue_data.get('key', ticket_key),
-                'summary': issue_data['fields'].get('summary', 'Sans titre'),
-                'description': description_content.strip(),
-                'status': issue_data['fields']['status']['name'],
-                'assignee': assignee_normalized,
-                'priority': (issue_data['fields']['priority']['name'] 
-                           if issue_data['fields'].get('priority') else 'Non définie'),
-                'issueType': issue_data['fields']['issuetype']['name'],
-                'created': issue_data['fields'].get('created', ''),
-                'updated': issue_data['fields'].get('updated', ''),
-                'reporter': (issue_data['fields']['reporter']['displayName'] 
-                           if issue_data['fields'].get('reporter') else 'Inconnu'),
-                'project': (issue_data['fields']['project']['name'] 
-                          if issue_data['fields'].get('project') else 'Inconnu')
-            }
-            
-            app.logger.info(f"✅ Détails récupérés pour {ticket_key}, assigné: {assignee_normalized}")
+            app.logger.info("✅ Détails récupérés pour %s, assigné: %s", ticket_key, assignee_normalized)
             return jsonify({
                 'success': True,
                 'ticket': ticket_details
             }), 200
         else:
-            status_code = response.status_code if response else 'N/A'
-            app.logger.warning(f"❌ Échec récupération détails {ticket_key} - Status: {status_code}")
+            status_code = response.status_code if response is not None else 'N/A'
+            app.logger.warning("❌ Échec récupération détails %s - Status: %s", ticket_key, status_code)
             
-            if response and response.status_code == 404:
-                return jsonify({
-                    'success': False,
-                    'error': 'Ticket non trouvé',
-                    'message': f'Le ticket {ticket_key} n\'existe pas'
-                }), 404
-            elif response and response.status_code == 403:
-                return jsonify({
-                    'success': False,
-                    'error': 'Permission refusée',
-                    'message': 'Vous n\'avez pas la permission d\'accéder à ce ticket'
-                }), 403
+            if response is not None and response.status_code == 404:
+                return error_response(404, 'Ticket non trouvé', f'Le ticket {ticket_key} n\'existe pas')
+            elif response is not None and response.status_code == 403:
+                return prebuilt_response(ERROR_FORBIDDEN_TICKET)
             else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Impossible de récupérer les détails',
-                    'message': 'Erreur réseau ou serveur Jira inaccessible'
-                }), 500
+                return prebuilt_response(ERROR_DETAILS_UNREACHABLE)
             
     except Exception as e:
-        app.logger.error(f"Erreur récupération détails {ticket_key}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la récupération des détails',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur récupération détails %s: %s", ticket_key, e)
+        return error_response(500, 'Erreur lors de la récupération des détails', str(e))
 
 @app.route('/api/tickets', methods=['POST'])
 @limiter.limit("10 per minute")
@@ -731,106 +1149,85 @@ def create_ticket(data):
         
         # Validations
         if len(summary) < 5:
-            return jsonify({
-                'success': False,
-                'error': 'Le résumé doit contenir au moins 5 caractères'
-            }), 400
+            return prebuilt_response(ERROR_SUMMARY_TOO_SHORT)
         
         if len(summary) > 255:
-            return jsonify({
-                'success': False,
-                'error': 'Le résumé ne peut pas dépasser 255 caractères'
-            }), 400
+            return prebuilt_response(ERROR_SUMMARY_TOO_LONG)
         
         if not issue_type:
             issue_type = 'Task'
         
-        # Valider le type de ticket
-        valid_issue_types = get_valid_issue_types()
-        issue_type_normalized = None
-        for valid_type in valid_issue_types:
-            if issue_type.lower() == valid_type.lower():
-                issue_type_normalized = valid_type
-                break
+        # Valider le type et l'assignee en parallèle (deux appels Jira indépendants)
+        issue_type_future = jira_pool.submit(match_issue_type, issue_type)
+        assignee_future = None
+        if assignee and normalize_assignee(assignee) != 'Non assigné':
+            assignee_future = jira_pool.submit(validate_account_id, assignee)
+        
+        issue_type_normalized = issue_type_future.result()
+        validated_assignee = assignee_future.result() if assignee_future else None
         
         if not issue_type_normalized:
-            app.logger.warning(f"Type de ticket invalide: {issue_type}")
-            return jsonify({
-                'success': False,
-                'error': 'Type de ticket invalide',
-                'message': f"Le type '{issue_type}' n'est pas valide. Types disponibles: {', '.join(valid_issue_types)}"
-            }), 400
+            app.logger.warning("Type de ticket invalide: %s", issue_type)
+            return error_response(400, 'Type de ticket invalide', f"Le type '{issue_type}' n'est pas valide. Types disponibles: {', '.join(get_valid_issue_types())}")
         
-        # Valider l'assignee si fourni
-        validated_assignee = None
-        if assignee:
-            # Normaliser d'abord
-            normalized_assignee = normalize_assignee(assignee)
-            if normalized_assignee != 'Non assigné':
-                validated_assignee = validate_account_id(assignee)
-                if not validated_assignee:
-                    app.logger.warning(f"Assignee invalide: {assignee}")
-                    return jsonify({
-                        'success': False,
-                        'error': 'Assignee invalide',
-                        'message': f"L'utilisateur '{assignee}' n'a pas été trouvé"
-                    }), 400
+        if assignee_future and not validated_assignee:
+            app.logger.warning("Assignee invalide: %s", assignee)
+            return error_response(400, 'Assignee invalide', f"L'utilisateur '{assignee}' n'a pas été trouvé")
         
-        app.logger.info(f"Création ticket - résumé: '{summary[:50]}...', type: {issue_type_normalized}, assignee: {validated_assignee}, priorité: {priority}")
+        if app.logger.isEnabledFor(logging.INFO):
+            app.logger.info("Création ticket - résumé: '%s...', type: %s, assignee: %s, priorité: %s", summary[:50], issue_type_normalized, validated_assignee, priority)
         
         success = jira_manager.create_ticket(
             summary=summary, 
             description=description, 
             issue_type=issue_type_normalized,
             priority=priority,
-            assignee=validated_assignee
+            assignee=validated_assignee,
+            # Type déjà validé contre le cache: évite un appel Jira bloquant de plus
+            validate_issue_type=False
         )
         
         if success:
-            app.logger.info(f"✅ Ticket créé avec succès")
+            invalidate_tickets_cache()
+            app.logger.info("✅ Ticket créé avec succès")
             return jsonify({
                 'success': True,
                 'message': f'Ticket créé avec succès',
                 'issue_type': issue_type_normalized
             }), 201
         else:
-            app.logger.warning(f"❌ Échec création ticket")
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la création du ticket',
-                'message': 'Vérifiez les paramètres et permissions'
-            }), 400
+            app.logger.warning("❌ Échec création ticket")
+            return prebuilt_response(ERROR_CREATE_FAILED)
             
     except Exception as e:
-        app.logger.error(f"Erreur création ticket: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la création du ticket',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur création ticket: %s", e)
+        return error_response(500, 'Erreur lors de la création du ticket', str(e))
 
 @app.route('/api/tickets/<ticket_key>', methods=['PUT'])
 @limiter.limit("20 per minute")
 @log_request
 @validate_jira_connection
 @validate_json()
+@validate_ticket_key
 def update_ticket(data, ticket_key):
     """Met à jour un ticket avec normalisation des assignés"""
     try:
-        if not ticket_key.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Clé du ticket requise'
-            }), 400
-        
         new_summary = data.get('summary', '').strip()
         new_description = data.get('description', '').strip()
         new_priority = data.get('priority', '').strip() or None
         new_issue_type = translate_issue_type(data.get('issueType'))
         
+        # Validations locales avant tout appel Jira
+        if new_summary and len(new_summary) < 5:
+            return prebuilt_response(ERROR_SUMMARY_TOO_SHORT)
+        
+        if not any([new_summary, new_description, new_priority, new_issue_type, 'assignee' in data]):
+            return prebuilt_response(ERROR_NO_UPDATE_FIELDS)
+        
         # CORRECTION : Gérer correctement l'assigné
         validated_assignee = None
         assignee_changed = False
+        assignee_future = None
         
         if 'assignee' in data:  # Vérifier si le champ assignee est présent dans la requête
             assignee_changed = True
@@ -839,48 +1236,28 @@ def update_ticket(data, ticket_key):
             # Si l'assigné est None, vide, ou "Non assigné", désassigner
             if new_assignee is None or new_assignee == "" or new_assignee == "Non assigné":
                 validated_assignee = None
-                app.logger.info(f"Désassignation du ticket {ticket_key}")
+                app.logger.info("Désassignation du ticket %s", ticket_key)
             else:
-                # Valider l'assigné
-                validated_assignee = validate_account_id(new_assignee)
-                if not validated_assignee:
-                    app.logger.warning(f"Assignee invalide: {new_assignee}")
-                    return jsonify({
-                        'success': False,
-                        'error': 'Assignee invalide',
-                        'message': f"L'utilisateur '{new_assignee}' n'a pas été trouvé"
-                    }), 400
+                # Valider l'assigné en parallèle de la validation du type
+                assignee_future = jira_pool.submit(validate_account_id, new_assignee)
         
-        # Validations
-        if new_summary and len(new_summary) < 5:
-            return jsonify({
-                'success': False,
-                'error': 'Le résumé doit contenir au moins 5 caractères'
-            }), 400
+        issue_type_future = jira_pool.submit(match_issue_type, new_issue_type) if new_issue_type else None
+        
+        if assignee_future:
+            validated_assignee = assignee_future.result()
+            if not validated_assignee:
+                app.logger.warning("Assignee invalide: %s", new_assignee)
+                return error_response(400, 'Assignee invalide', f"L'utilisateur '{new_assignee}' n'a pas été trouvé")
         
         # Valider le nouveau type si fourni
         new_issue_type_normalized = None
-        if new_issue_type:
-            valid_issue_types = get_valid_issue_types()
-            for valid_type in valid_issue_types:
-                if new_issue_type.lower() == valid_type.lower():
-                    new_issue_type_normalized = valid_type
-                    break
+        if issue_type_future:
+            new_issue_type_normalized = issue_type_future.result()
             
             if not new_issue_type_normalized:
-                return jsonify({
-                    'success': False,
-                    'error': 'Type de ticket invalide',
-                    'message': f"Le type '{new_issue_type}' n'est pas valide"
-                }), 400
+                return error_response(400, 'Type de ticket invalide', f"Le type '{new_issue_type}' n'est pas valide")
         
-        if not any([new_summary, new_description, new_priority, new_issue_type_normalized, assignee_changed]):
-            return jsonify({
-                'success': False,
-                'error': 'Au moins un champ doit être fourni pour la mise à jour'
-            }), 400
-        
-        app.logger.info(f"Mise à jour ticket {ticket_key} - Assigné: {validated_assignee if assignee_changed else 'inchangé'}")
+        app.logger.info("Mise à jour ticket %s - Assigné: %s", ticket_key, validated_assignee if assignee_changed else 'inchangé')
         
         success = jira_manager.update_ticket(
             ticket_key=ticket_key, 
@@ -892,25 +1269,18 @@ def update_ticket(data, ticket_key):
         )
         
         if success:
-            app.logger.info(f"✅ Ticket {ticket_key} mis à jour avec succès")
+            invalidate_tickets_cache()
+            app.logger.info("✅ Ticket %s mis à jour avec succès", ticket_key)
             return jsonify({
                 'success': True,
                 'message': f'Ticket {ticket_key} mis à jour avec succès'
             }), 200
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la mise à jour du ticket',
-                'message': 'Vérifiez les valeurs fournies et les permissions'
-            }), 400
+            return prebuilt_response(ERROR_UPDATE_FAILED)
             
     except Exception as e:
-        app.logger.error(f"Erreur mise à jour ticket {ticket_key}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la mise à jour du ticket',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur mise à jour ticket %s: %s", ticket_key, e)
+        return error_response(500, 'Erreur lors de la mise à jour du ticket', str(e))
 
 @app.route('/api/issue-types', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -919,50 +1289,99 @@ def update_ticket(data, ticket_key):
 def get_issue_types():
     """Liste les types de tickets disponibles dans le projet."""
     try:
-        response = jira_manager._make_request("GET", f"project/{jira_manager.project_key}")
-        if not response:
-            app.logger.error("Échec récupération types de tickets: aucune réponse")
-            return jsonify({
-                'success': False,
-                'error': 'Échec récupération types de tickets',
-                'message': 'Erreur réseau ou serveur Jira inaccessible'
-            }), 500
-        if response.status_code == 200:
-            issue_types = [t['name'] for t in response.json()['issueTypes'] if not t.get('subtask')]
-            app.logger.info(f"Types de tickets récupérés: {issue_types}")
-            return jsonify({
-                'success': True,
-                'issue_types': issue_types
-            }), 200
-        app.logger.warning(f"Échec récupération types de tickets: {response.status_code} - {response.text}")
-        return jsonify({
-            'success': False,
-            'error': 'Échec récupération types de tickets',
-            'message': response.text
-        }), response.status_code
+        entry, failed = _get_issue_types_entry(use_default=False)
+        if entry is None:
+            if failed is None:
+                return prebuilt_response(ERROR_ISSUE_TYPES_UNREACHABLE)
+            app.logger.warning("Échec récupération types de tickets: %s - %s", failed.status_code, failed.text)
+            return error_response(failed.status_code, 'Échec récupération types de tickets', failed.text)
+        return conditional_jsonify({
+            'success': True,
+            'issue_types': entry[0]
+        })
     except Exception as e:
-        app.logger.error(f"Erreur récupération types de tickets: {str(e)}")
+        app.logger.error("Erreur récupération types de tickets: %s", e)
+        return error_response(500, 'Erreur récupération types de tickets', str(e))
+
+@app.route('/api/cache/issue-types', methods=['DELETE'])
+@limiter.limit("5 per minute")
+@log_request
+def clear_issue_types_cache():
+    """Invalide le cache des types de tickets (après modification du schéma du projet)"""
+    invalidate_issue_types_cache()
+    app.logger.info("Cache des types de tickets invalidé")
+    return jsonify({
+        'success': True,
+        'message': 'Cache des types de tickets invalidé'
+    }), 200
+
+# Événements Jira qui modifient le schéma du projet (types de tickets, workflow)
+PROJECT_CONFIG_WEBHOOK_EVENTS = frozenset({
+    'project_updated', 'issuetype_created', 'issuetype_updated', 'issuetype_deleted'
+})
+
+@app.route('/api/webhooks/jira', methods=['POST'])
+@limiter.limit("30 per minute")
+@log_request
+def jira_webhook():
+    """Reçoit les webhooks Jira et invalide les caches de configuration du projet"""
+    event = (request.get_json(silent=True) or {}).get('webhookEvent')
+    if event in PROJECT_CONFIG_WEBHOOK_EVENTS:
+        invalidate_issue_types_cache()
+        _statuses_cache.clear()
+        app.logger.info("Webhook %s: caches de configuration du projet invalidés", event)
+    return jsonify({'success': True}), 200
+
+@app.route('/api/cache/flush', methods=['POST'])
+@limiter.limit("5 per minute")
+@log_request
+def flush_caches():
+    """Vide tous les caches en mémoire (types, tickets, analytics, statuts, transitions, utilisateurs)"""
+    invalidate_issue_types_cache()
+    invalidate_tickets_cache()
+    _statuses_cache.clear()
+    _transitions_cache.clear()
+    _account_id_cache.clear()
+    app.logger.info("Tous les caches ont été vidés")
+    return jsonify({
+        'success': True,
+        'message': 'Caches vidés'
+    }), 200
+
+@app.route('/api/tickets/transitions', methods=['POST'])
+@limiter.limit("20 per minute")
+@log_request
+@validate_jira_connection
+@validate_json(required_fields=['keys'])
+def get_batch_transitions(data):
+    """Récupère les transitions disponibles de plusieurs tickets en un seul appel"""
+    try:
+        keys, error = parse_batch_keys(data)
+        if error:
+            return error
+        
+        app.logger.info("Récupération transitions pour %s tickets", len(keys))
+        transitions = batch_fetch(keys, get_cached_transitions)
+        
         return jsonify({
-            'success': False,
-            'error': 'Erreur récupération types de tickets',
-            'message': str(e)
-        }), 500
+            'success': True,
+            'transitions': transitions
+        }), 200
+        
+    except Exception as e:
+        app.logger.error("Erreur récupération transitions groupées: %s", e)
+        return error_response(500, 'Erreur lors de la récupération des transitions', str(e))
 
 @app.route('/api/tickets/<ticket_key>/transitions', methods=['GET'])
 @limiter.limit("50 per minute")
 @log_request
 @validate_jira_connection
+@validate_ticket_key
 def get_ticket_transitions(ticket_key):
     """Récupère les transitions disponibles pour un ticket"""
     try:
-        if not ticket_key.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Clé du ticket requise'
-            }), 400
-        
-        app.logger.info(f"Récupération transitions pour {ticket_key}")
-        transitions = jira_manager.get_available_transitions(ticket_key)
+        app.logger.info("Récupération transitions pour %s", ticket_key)
+        transitions = get_cached_transitions(ticket_key)
         
         if transitions:
             return jsonify({
@@ -970,161 +1389,118 @@ def get_ticket_transitions(ticket_key):
                 'transitions': transitions
             }), 200
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Impossible de récupérer les transitions',
-                'message': 'Vérifiez que le ticket existe'
-            }), 404
+            return prebuilt_response(ERROR_TRANSITIONS_NOT_FOUND)
             
     except Exception as e:
-        app.logger.error(f"Erreur récupération transitions {ticket_key}: {str(e)}")
+        app.logger.error("Erreur récupération transitions %s: %s", ticket_key, e)
         if "permission" in str(e).lower():
-            return jsonify({
-                'success': False,
-                'error': 'Permission refusée',
-                'message': 'Vous n\'avez pas les permissions nécessaires pour accéder aux transitions'
-            }), 403
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la récupération des transitions',
-            'message': str(e)
-        }), 500
+            return prebuilt_response(ERROR_FORBIDDEN_TRANSITIONS)
+        return error_response(500, 'Erreur lors de la récupération des transitions', str(e))
 
 @app.route('/api/tickets/<ticket_key>/transition', methods=['POST'])
 @limiter.limit("15 per minute")
 @log_request
 @validate_jira_connection
 @validate_json(required_fields=['transition_name'])
+@validate_ticket_key
 def transition_ticket(data, ticket_key):
     """Change le statut d'un ticket"""
     try:
-        if not ticket_key.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Clé du ticket requise'
-            }), 400
-        
         transition_name = data['transition_name'].strip()
         comment = data.get('comment', '').strip() or None
         
         if not transition_name:
-            return jsonify({
-                'success': False,
-                'error': 'Nom de la transition requis'
-            }), 400
+            return prebuilt_response(ERROR_TRANSITION_NAME_REQUIRED)
         
-        app.logger.info(f"Transition ticket {ticket_key} vers '{transition_name}'")
+        app.logger.info("Transition ticket %s vers '%s'", ticket_key, transition_name)
         
-        success = True
-        failed_operations = []
-        
-        # Ajout du commentaire si requis
-        if any(word in transition_name.lower() for word in ['terminé', 'done', 'closed', 'resolve']) and comment:
-            comment_payload = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": comment}]
-                        }
-                    ]
-                }
-            }
-            response = jira_manager._make_request('POST', f'issue/{ticket_key}/comment', json=comment_payload)
-            if not response or response.status_code not in (200, 201):
-                failed_operations.append("Ajout commentaire échoué")
-                success = False
-            else:
-                app.logger.info(f"✅ Commentaire ajouté pour {ticket_key}")
+        # Le commentaire de clôture est envoyé avec la transition (un seul appel Jira)
+        if comment and not DONE_TRANSITION_RE.search(transition_name):
+            comment = None
         
-        # Effectuer la transition
-        transition_success = jira_manager.transition_ticket(ticket_key, transition_name)
-        if not transition_success:
-            failed_operations.append("Transition échouée")
-            success = False
-        
-        if success or transition_success:
-            app.logger.info(f"✅ Ticket {ticket_key} transitionné vers '{transition_name}'")
+        if jira_manager.transition_ticket(ticket_key, transition_name, comment):
+            invalidate_tickets_cache()
+            _transitions_cache.delete(ticket_key)
+            app.logger.info("✅ Ticket %s transitionné vers '%s'", ticket_key, transition_name)
             return jsonify({
                 'success': True,
                 'message': f'Ticket {ticket_key} transitionné avec succès'
             }), 200
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la transition du ticket',
-                'message': f"Erreurs: {', '.join(failed_operations)}"
-            }), 400
+            return prebuilt_response(ERROR_TRANSITION_FAILED)
             
     except Exception as e:
-        app.logger.error(f"Erreur transition ticket {ticket_key}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la transition du ticket',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur transition ticket %s: %s", ticket_key, e)
+        return error_response(500, 'Erreur lors de la transition du ticket', str(e))
 
 @app.route('/api/tickets/<ticket_key>', methods=['DELETE'])
 @limiter.limit("5 per minute")
 @log_request
 @validate_jira_connection
+@validate_ticket_key
 def delete_ticket(ticket_key):
     """Supprime un ticket"""
     try:
-        if not ticket_key.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Clé du ticket requise'
-            }), 400
-        
-        app.logger.info(f"Suppression ticket {ticket_key}")
+        app.logger.info("Suppression ticket %s", ticket_key)
         
         response = jira_manager._make_request("DELETE", f"issue/{ticket_key}")
         
-        if not response:
-            return jsonify({
-                'success': False,
-                'error': 'Échec de la suppression du ticket',
-                'message': 'Erreur réseau ou serveur Jira inaccessible'
-            }), 500
+        if response is None:
+            return prebuilt_response(ERROR_DELETE_UNREACHABLE)
             
         if response.status_code == 204:
-            app.logger.info(f"✅ Ticket {ticket_key} supprimé avec succès")
+            invalidate_tickets_cache()
+            app.logger.info("✅ Ticket %s supprimé avec succès", ticket_key)
             return jsonify({
                 'success': True,
                 'message': f'Ticket {ticket_key} supprimé avec succès'
             }), 200
         else:
-            app.logger.warning(f"❌ Échec suppression ticket {ticket_key}")
+            app.logger.warning("❌ Échec suppression ticket %s", ticket_key)
             
             if response.status_code == 404:
-                return jsonify({
-                    'success': False,
-                    'error': 'Ticket non trouvé',
-                    'message': f'Le ticket {ticket_key} n\'existe pas'
-                }), 404
+                return error_response(404, 'Ticket non trouvé', f'Le ticket {ticket_key} n\'existe pas')
             elif response.status_code == 403:
-                return jsonify({
-                    'success': False,
-                    'error': 'Permission refusée',
-                    'message': 'Vous n\'avez pas la permission de supprimer ce ticket'
-                }), 403
+                return prebuilt_response(ERROR_FORBIDDEN_DELETE)
             else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Échec de la suppression du ticket',
-                    'message': response.text
-                }), response.status_code
+                return error_response(response.status_code, 'Échec de la suppression du ticket', response.text)
             
     except Exception as e:
-        app.logger.error(f"Erreur suppression ticket {ticket_key}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la suppression du ticket',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur suppression ticket %s: %s", ticket_key, e)
+        return error_response(500, 'Erreur lors de la suppression du ticket', str(e))
+
+# Les statistiques sont recalculées en arrière-plan; la route sert le dernier instantané
+STATS_REFRESH_INTERVAL = int(os.getenv('STATS_REFRESH_INTERVAL', 60))
+_stats_snapshot = {'data': None}
+
+def compute_stats() -> Optional[Dict]:
+    """Calcule les statistiques des tickets depuis les lignes partagées avec les analytics (None si Jira n'a pas répondu)"""
+    tickets = get_analytics_tickets()
+    if tickets is None:
+        return None
+    
+    by_status = Counter(ticket['status'] for ticket in tickets)
+    by_assignee = Counter(ticket['assignee'] for ticket in tickets)
+    unassigned_count = by_assignee.pop('Non assigné', 0)
+    
+    return {
+        'total_tickets': len(tickets),
+        'by_status': dict(by_status),
+        'by_assignee': dict(by_assignee),
+        'unassigned_count': unassigned_count
+    }
+
+def refresh_stats() -> Optional[Dict]:
+    """Remplace l'instantané des statistiques et les retourne (l'ancien est conservé si Jira n'a pas répondu)"""
+    generation = _tickets_generation[0]
+    stats = compute_stats()
+    if stats is None:
+        app.logger.warning("Rafraîchissement des statistiques échoué, instantané précédent conservé")
+        return None
+    # Un calcul lancé avant une modification ne doit pas écraser la réinitialisation
+    if generation == _tickets_generation[0]:
+        _stats_snapshot['data'] = stats
+    return stats
 
 @app.route('/api/stats', methods=['GET'])
 @limiter.limit("20 per minute")
@@ -1133,45 +1509,64 @@ def delete_ticket(ticket_key):
 def get_stats():
     """Récupère les statistiques des tickets avec normalisation des assignés"""
     try:
-        tickets = jira_manager.get_tickets()
-        
-        if not tickets:
-            return jsonify({
-                'total_tickets': 0,
-                'by_status': {},
-                'by_assignee': {},
-                'unassigned_count': 0
-            }), 200
-        
-        stats = {
-            'total_tickets': 0,
-            'by_status': {},
-            'by_assignee': {},
-            'unassigned_count': 0
-        }
-        
-        for status, ticket_list in tickets.items():
-            stats['by_status'][status] = len(ticket_list)
-            stats['total_tickets'] += len(ticket_list)
-            
-            for ticket in ticket_list:
-                ticket_info = parse_ticket_info(ticket)
-                if ticket_info:
-                    assignee = normalize_assignee(ticket_info['assignee'])
-                    if assignee == 'Non assigné':
-                        stats['unassigned_count'] += 1
-                    else:
-                        stats['by_assignee'][assignee] = stats['by_assignee'].get(assignee, 0) + 1
+        stats = _stats_snapshot['data']
+        if stats is None:
+            # Premier appel: calcul synchrone, puis rafraîchissement en arrière-plan
+            stats = refresh_stats()
+            if stats is None:
+                return prebuilt_response(ERROR_JIRA_UNAVAILABLE)
+            start_refresher('stats', STATS_REFRESH_INTERVAL, refresh_stats)
         
-        return jsonify(stats), 200
+        return conditional_jsonify(stats)
         
     except Exception as e:
-        app.logger.error(f"Erreur récupération statistiques: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la récupération des statistiques',
-            'message': str(e)
-        }), 500
+        app.logger.error("Erreur récupération statistiques: %s", e)
+        return error_response(500, 'Erreur lors de la récupération des statistiques', str(e))
+
+def compute_analytics() -> Optional[Dict]:
+    """Calcule les statistiques analytiques de tous les tickets (None si Jira n'a pas répondu)"""
+    all_tickets = get_analytics_tickets()
+    if all_tickets is None:
+        return None
+
+    if not all_tickets:
+        return {
+            'tickets_per_week': [],
+            'priority_distribution': {},
+            'type_distribution': {},
+            'avg_resolution_time': 0.0
+        }
+
+    # Ticket count per week (date de création parsée une seule fois par ticket)
+    created_dates = {}
+    tickets_per_week = defaultdict(int)
+    for ticket in all_tickets:
+        if ticket['created']:
+            created_date = created_dates[ticket['key']] = parse_jira_datetime(ticket['created'])
+            year_week = f"{created_date.year}-{created_date.isocalendar()[1]:02d}"
+            tickets_per_week[year_week] += 1
+    tickets_per_week_list = [{"week": k, "count": v} for k, v in sorted(tickets_per_week.items())]
+
+    # Priority distribution
+    priority_dist = Counter(ticket.get('priority', 'Unknown') for ticket in all_tickets)
+
+    # Type distribution
+    type_dist = Counter(ticket.get('issue_type', 'Unknown') for ticket in all_tickets)
+
+    # Average resolution time (in days, for resolved tickets)
+    resolution_times = []
+    for ticket in all_tickets:
+        if ticket['resolutiondate'] and ticket['created']:
+            resolved = parse_jira_datetime(ticket['resolutiondate'])
+            resolution_times.append((resolved - created_dates[ticket['key']]).total_seconds() / 86400)
+    avg_resolution = sum(resolution_times) / len(resolution_times) if resolution_times else 0.0
+
+    return {
+        'tickets_per_week': tickets_per_week_list,
+        'priority_distribution': dict(priority_dist),
+        'type_distribution': dict(type_dist),
+        'avg_resolution_time': round(avg_resolution, 1)
+    }
 
 @app.route('/api/analytics', methods=['GET'])
 @limiter.limit("10 per minute")
@@ -1181,76 +1576,78 @@ def get_analytics():
     """Récupère les statistiques analytiques des tickets"""
     try:
         app.logger.info("Starting analytics retrieval")
-        tickets_by_status = jira_manager.get_tickets()
-        all_tickets = []
-        
-        for status, ticket_list in tickets_by_status.items():
-            for ticket_string in ticket_list:
-                ticket_info = parse_ticket_info(ticket_string)
-                if ticket_info:
-                    response = jira_manager._make_request("GET", f"issue/{ticket_info['key']}")
-                    if response and response.status_code == 200:
-                        ticket_data = response.json()
-                        ticket_info['created'] = ticket_data['fields'].get('created')
-                        ticket_info['resolutiondate'] = ticket_data['fields'].get('resolutiondate')
-                        # Normaliser l'assigné dans les analytics
-                        assignee_raw = None
-                        if ticket_data['fields'].get('assignee'):
-                            assignee_raw = ticket_data['fields']['assignee'].get('displayName')
-                        ticket_info['assignee'] = normalize_assignee(assignee_raw)
-                        all_tickets.append(ticket_info)
-
-        if not all_tickets:
-            return jsonify({
-                'tickets_per_week': [],
-                'priority_distribution': {},
-                'type_distribution': {},
-                'avg_resolution_time': 0.0
-            }), 200
+        payload = get_cached_analytics('analytics', compute_analytics)
+        if payload is None:
+            # Un échec de la recherche Jira n'est pas un projet vide
+            return prebuilt_response(ERROR_JIRA_UNAVAILABLE)
+        return conditional_jsonify(payload)
 
-        # Ticket count per week
-        tickets_per_week = defaultdict(int)
-        for ticket in all_tickets:
-            if ticket['created']:
-                created_date = parser.parse(ticket['created'])
-                year_week = f"{created_date.year}-{created_date.isocalendar()[1]:02d}"
-                tickets_per_week[year_week] += 1
-        tickets_per_week_list = [{"week": k, "count": v} for k, v in sorted(tickets_per_week.items())]
-
-        # Priority distribution
-        priority_dist = Counter(ticket.get('priority', 'Unknown') for ticket in all_tickets)
-
-        # Type distribution
-        type_dist = Counter(ticket.get('issue_type', 'Unknown') for ticket in all_tickets)
-
-        # Average resolution time (in days, for resolved tickets)
-        resolution_times = []
-        for ticket in all_tickets:
-            if ticket['resolutiondate'] and ticket['created']:
-                created = parser.parse(ticket['created'])
-                resolved = parser.parse(ticket['resolutiondate'])
-                resolution_times.append((resolved - created).total_seconds() / 86400)
-        avg_resolution = sum(resolution_times) / len(resolution_times) if resolution_times else 0.0
+    except Exception as e:
+        app.logger.error("Error in analytics retrieval: %s", e, exc_info=True)
+        return error_response(500, 'Erreur lors de la récupération des analytics', str(e))
 
-        return jsonify({
-            'tickets_per_week': tickets_per_week_list,
-            'priority_distribution': dict(priority_dist),
-            'type_distribution': dict(type_dist),
-            'avg_resolution_time': round(avg_resolution, 1)
-        }), 200
+def compute_filtered_analytics(time_filter: str) -> Optional[Dict]:
+    """Calcule les analytics sur la période demandée ('week', 'month' ou tout), None si Jira n'a pas répondu"""
+    all_tickets = get_analytics_tickets()
+    if all_tickets is None:
+        return None
 
-    except Exception as e:
-        app.logger.error(f"Error in analytics retrieval: {str(e)}")
-        app.logger.error(f"Traceback: {traceback.format_exc()}")
-        return jsonify({
-            'success': False,
-            'error': 'Erreur lors de la récupération des analytics',
-            'message': str(e)
-        }), 500
+    current_date = datetime.now(timezone.utc)
+    filter_date = None
+    if time_filter == 'week':
+        filter_date = current_date - timedelta(days=7)
+    elif time_filter == 'month':
+        filter_date = current_date - timedelta(days=30)
+
+    # Un seul parsing de la date de création par ticket, puis filtrage sur la période
+    filtered = []
+    for ticket in all_tickets:
+        created_str = ticket['created']
+        if created_str:
+            try:
+                created = parse_jira_datetime(created_str).astimezone(timezone.utc)
+            except ValueError as e:
+                app.logger.error("Error parsing created for %s: %s", ticket.get('key', 'unknown'), e)
+                continue
+            if filter_date is None or created >= filter_date:
+                filtered.append((ticket, created))
+
+    tickets_per_week = Counter(f"{created.year}-{created.isocalendar()[1]:02d}" for _, created in filtered)
+    priority_distribution = Counter(ticket.get('priority', 'Unknown') for ticket, _ in filtered)
+    type_distribution = Counter('Task' if ticket['issue_type'] == 'Tâche' else ticket['issue_type'] for ticket, _ in filtered)
+    # Utiliser la valeur normalisée de l'assigné
+    assignment_distribution = Counter(
+        'Non assignés' if ticket['assignee'] == 'Non assigné' else 'Assignés' for ticket, _ in filtered
+    )
+
+    # Resolution calculation with fallback to 'updated'
+    total_resolution_time = 0
+    resolved_count = 0
+    for ticket, created in filtered:
+        resolution_date_str = ticket['resolutiondate'] or ticket['updated']
+        if resolution_date_str:
+            try:
+                resolution_date = parse_jira_datetime(resolution_date_str).astimezone(timezone.utc)
+            except ValueError as e:
+                app.logger.error("Error parsing resolution/updated for %s: %s", ticket['key'], e)
+                continue
+            resolution_time = (resolution_date - created).days
+            if resolution_time >= 0:
+                total_resolution_time += resolution_time
+                resolved_count += 1
+
+    avg_resolution_time = total_resolution_time / resolved_count if resolved_count > 0 else 0.0
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
+    return {
+        'success': True,
+        'tickets_per_week': [{'week': week, 'count': count} for week, count in sorted(tickets_per_week.items())],
+        'priority_distribution': dict(priority_distribution),
+        'type_distribution': dict(type_distribution),
+        'assignment_distribution': dict(assignment_distribution),
+        'avg_resolution_time': round(avg_resolution_time, 1),
+        'total_tickets': len(filtered),
+        'resolved_tickets': resolved_count
+    }
 
 @app.route('/api/analytics/filtered', methods=['GET'])
 @limiter.limit("10 per minute")
@@ -1260,101 +1657,20 @@ def get_filtered_analytics():
     """Récupère les analytics filtrées avec normalisation des assignés"""
     try:
         time_filter = request.args.get('time', 'all')
-        tickets_by_status = jira_manager.get_tickets()
-        
-        all_tickets = []
-        for status, ticket_list in tickets_by_status.items():
-            for ticket_string in ticket_list:
-                ticket_info = parse_ticket_info(ticket_string)
-                if ticket_info:
-                    response = jira_manager._make_request("GET", f"issue/{ticket_info['key']}")
-                    if response and response.status_code == 200:
-                        ticket_data = response.json()
-                        ticket_info['created'] = ticket_data['fields'].get('created')
-                        ticket_info['resolution_date'] = ticket_data['fields'].get('resolutiondate')
-                        ticket_info['updated'] = ticket_data['fields'].get('updated')
-                        
-                        # Normaliser l'assigné
-                        assignee_raw = None
-                        if ticket_data['fields'].get('assignee'):
-                            assignee_raw = ticket_data['fields']['assignee'].get('displayName')
-                        ticket_info['assignee'] = normalize_assignee(assignee_raw)
-                        
-                        issue_type = ticket_data['fields'].get('issuetype', {}).get('name', 'Unknown')
-                        ticket_info['type'] = 'Task' if issue_type == 'Tâche' else issue_type
-                        all_tickets.append(ticket_info)
-
-        tickets_per_week = defaultdict(int)
-        priority_distribution = defaultdict(int)
-        type_distribution = defaultdict(int)
-        assignment_distribution = defaultdict(int)
-        total_resolution_time = 0
-        resolved_count = 0
-
-        current_date = datetime.now(tzutc())
-        filter_date = None
-        if time_filter == 'week':
-            filter_date = current_date - timedelta(days=7)
-        elif time_filter == 'month':
-            filter_date = current_date - timedelta(days=30)
-
-        filtered_ticket_count = 0
-        
-        for ticket in all_tickets:
-            created_str = ticket['created']
-            if created_str:
-                try:
-                    created = parser.parse(created_str).astimezone(tzutc())
-                    
-                    include_ticket = True
-                    if filter_date is not None:
-                        include_ticket = created >= filter_date
-                    
-                    if include_ticket:
-                        filtered_ticket_count += 1
-                        year_week = f"{created.year}-{created.isocalendar()[1]:02d}"
-                        tickets_per_week[year_week] += 1
-                        priority_distribution[ticket.get('priority', 'Unknown')] += 1
-                        type_distribution[ticket.get('type', 'Unknown')] += 1
-                        
-                        # Utiliser la valeur normalisée de l'assigné
-                        normalized_assignee = ticket['assignee']
-                        assignment_distribution['Non assignés' if normalized_assignee == 'Non assigné' else 'Assignés'] += 1
-
-                        # Resolution calculation with fallback to 'updated'
-                        resolution_date_str = ticket.get('resolution_date') or ticket.get('updated')
-                        if resolution_date_str:
-                            try:
-                                resolution_date = parser.parse(resolution_date_str).astimezone(tzutc())
-                                resolution_time = (resolution_date - created).days
-                                if resolution_time >= 0:
-                                    total_resolution_time += resolution_time
-                                    resolved_count += 1
-                            except ValueError as e:
-                                logger.error(f"Error parsing resolution/updated for {ticket['key']}: {e}")
-                        
-                except ValueError as e:
-                    logger.error(f"Error parsing created for {ticket.get('key', 'unknown')}: {e}")
-
-        avg_resolution_time = total_resolution_time / resolved_count if resolved_count > 0 else 0.0
-
-        return jsonify({
-            'success': True,
-            'tickets_per_week': [{'week': week, 'count': count} for week, count in sorted(tickets_per_week.items())],
-            'priority_distribution': dict(priority_distribution),
-            'type_distribution': dict(type_distribution),
-            'assignment_distribution': dict(assignment_distribution),
-            'avg_resolution_time': round(avg_resolution_time, 1),
-            'total_tickets': filtered_ticket_count,
-            'resolved_tickets': resolved_count
-        }), 200
+        # Toute valeur autre que 'week'/'month' donne le même résultat: une seule entrée de cache
+        if time_filter not in ('week', 'month'):
+            time_filter = 'all'
+        payload = get_cached_analytics('analytics_filtered', lambda: compute_filtered_analytics(time_filter), time_filter)
+        if payload is None:
+            return prebuilt_response(ERROR_JIRA_UNAVAILABLE)
+        return conditional_jsonify(payload)
         
     except Exception as e:
-        logger.error(f"Error in filtered analytics: {str(e)}", exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+        app.logger.error("Error in filtered analytics: %s", e, exc_info=True)
+        return error_response(500, str(e))
 
 if __name__ == '__main__':
-    if not jira_manager:
+    if not get_jira_manager():
         print("❌ Impossible de démarrer l'API sans connexion Jira valide")
         sys.exit(1)
     
@@ -1368,7 +1684,7 @@ if __name__ == '__main__':
     try:
         app.run(
             host='0.0.0.0',
-            port=int(os.getenv('PORT', 5000)),
+            port=app.config['PORT'],
             debug=app.config['DEBUG'],
             threaded=True
         )
@@ -0,0 +1,17 @@
+"""
+Configuration Gunicorn de Jira Manager Pro.
+Plusieurs processus évitent la contention du GIL; les threads couvrent l'attente des appels Jira.
+Avec GUNICORN_WORKER_CLASS=gevent (paquet gevent requis), chaque worker gère des centaines
+de connexions en attente de Jira; gunicorn applique lui-même le monkey-patching.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv('GUNICORN_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 500))
+keepalive = 30
+timeout = 60
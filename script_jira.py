@@ -5,6 +5,7 @@ Improved Jira API Script
 A command-line tool for managing Jira tickets with enhanced error handling and security.
 """
 
+import atexit
 import requests
 from requests.auth import HTTPBasicAuth
 import json
@@ -15,20 +16,144 @@ from dotenv import load_dotenv
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import logging
+import random
+import re
+import threading
+import time
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+# Maximum number of times a request is replayed after a 429 response
+MAX_RATE_LIMIT_RETRIES = 3
+# How long a 404 from Jira is remembered, so repeated lookups of a missing ticket stay local
+NOT_FOUND_CACHE_TTL = 60
+# Upper bound on remembered 404s (batch routes can submit many never-repeated keys)
+NOT_FOUND_CACHE_MAXSIZE = 1024
+# How long the project's issue types are reused before being fetched again
+ISSUE_TYPES_CACHE_TTL = 300
+
+# Issues requested per search page (Jira may cap it lower; pages follow nextPageToken)
+SEARCH_BATCH_SIZE = int(os.getenv("JIRA_SEARCH_BATCH_SIZE", 500))
+# Tickets transitioned concurrently by transition_tickets
+BULK_TRANSITION_WORKERS = int(os.getenv("JIRA_BULK_TRANSITION_WORKERS", 8))
+
+# Upper bound on open connections to Jira; extra threads wait for a keep-alive
+# connection instead of opening (and discarding) a fresh TLS connection
+POOL_MAXSIZE = int(os.getenv("JIRA_POOL_MAXSIZE", 20))
+
+# Fields needed to build the ticket strings returned by get_tickets/search_tickets
+TICKET_FIELDS = "summary,assignee,issuetype,priority,status"
+# Display string for one ticket (parsed back by the API's parse_ticket_info)
+TICKET_FORMAT = "{key}: {summary} [{assignee}] [{type}] [{priority}]".format
+
+# Closing transitions, for which a comment is offered (accented or not)
+DONE_TRANSITION_RE = re.compile(r"termin[eé]|done|closed|resolve", re.IGNORECASE)
+
+# Exponential backoff used when Jira sends no Retry-After header
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+# Longest Retry-After honoured in-thread; beyond it the 429 is returned to the caller
+RETRY_AFTER_CAP = 10.0
+
+# 5xx are retried by urllib3 with exponential backoff; 429 is handled in _make_request.
+# Retry objects are never mutated (urllib3 derives a new one per attempt), so one is shared.
+JIRA_RETRY = Retry(
+    total=3,
+    backoff_factor=BACKOFF_BASE,
+    status_forcelist=(500, 502, 503, 504)
+)
+
+
+def parse_json(response: requests.Response):
+    """Decode a Jira response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def adf_document(text: str) -> Dict:
+    """Wrap plain text in a single-paragraph Atlassian Document Format (ADF) document."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}] if text else []}
+        ]
+    }
+
+
+class RateLimiter:
+    """Token bucket pacing outgoing Jira requests (thread-safe)."""
+
+    def __init__(self, rate: float = 10.0, capacity: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping only when the bucket is empty."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            # A negative balance reserves a slot for this caller
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def update_from_headers(self, headers) -> None:
+        """Tune the bucket from Jira's X-RateLimit-* response headers."""
+        try:
+            fill_rate = headers.get("X-RateLimit-FillRate")
+            interval = headers.get("X-RateLimit-Interval-Seconds")
+            limit = headers.get("X-RateLimit-Limit")
+            with self.lock:
+                if fill_rate and interval and float(interval) > 0:
+                    self.rate = float(fill_rate) / float(interval)
+                if limit:
+                    self.capacity = float(limit)
+                    self.tokens = min(self.tokens, self.capacity)
+        except ValueError:
+            pass
+
+
 class JiraManager:
-    def __init__(self):
+    def __init__(self, validate_connection: Optional[bool] = None):
+        """Set up the Jira client.
+
+        The GET /myself credential check costs a round-trip at startup, so it only runs
+        when validate_connection is True or, by default, when JIRA_VALIDATE=1 is set;
+        otherwise bad credentials surface on the first real call.
+        """
         self.jira_url = os.getenv("JIRA_URL")
         self.email = os.getenv("JIRA_EMAIL")
         self.api_token = os.getenv("JIRA_TOKEN")
         self.project_key = os.getenv("JIRA_PROJECT_KEY")
+        # JQL of the full ticket list, built once (also used for the refreshed API list)
+        self._jql_all = f"project = {self.project_key} ORDER BY status ASC, created DESC"
         
         self.auth = HTTPBasicAuth(self.email, self.api_token)
         self.headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        self.session = self._create_session()
+        self.rate_limiter = RateLimiter()
+        self._not_found: Dict[str, float] = {}
+        self._not_found_lock = threading.Lock()
+        # (issue types, monotonic expiry), replaced as a whole so readers never see half an update
+        self._issue_types_cache: Optional[tuple] = None
+        # Last ticket list shown by get_tickets, patched in place after each mutation
+        self._ticket_cache: Optional[Dict[str, List[str]]] = None
+        atexit.register(self.session.close)
         
         # Setup logging
         logging.basicConfig(
@@ -39,8 +164,11 @@ class JiraManager:
         )
         self.logger = logging.getLogger(__name__)
         
+        if validate_connection is None:
+            validate_connection = os.getenv("JIRA_VALIDATE", "0") == "1"
+        
         # Test connection on initialization
-        if not self._test_connection():
+        if validate_connection and not self._test_connection():
             self.logger.error("❌ Failed to connect to Jira. Please check your credentials.")
             print("❌ Failed to connect to Jira. Please check your credentials.")
             sys.exit(1)
@@ -48,43 +176,127 @@ class JiraManager:
     def _test_connection(self) -> bool:
         """Test if the connection to Jira is working."""
         try:
-            url = f"{self.jira_url}/rest/api/3/myself"
             response = self._make_request("GET", "myself")
             return response and response.status_code == 200
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Connection test failed: {str(e)}")
+            self.logger.error("Connection test failed: %s", e)
             return False
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[requests.Response]:
-        """Make a request to Jira API with error handling and retry."""
-        url = f"{self.jira_url}/rest/api/3/{endpoint}"
-        
+    def _create_session(self) -> requests.Session:
+        """Create a pooled session reused by every request (keep-alive, retry on 5xx)."""
         session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry)
+        session.auth = self.auth
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=JIRA_RETRY, pool_block=True)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response, attempt: int) -> Optional[float]:
+        """Delay before replaying a 429: Retry-After if present, else capped exponential backoff with jitter.
+
+        Returns None when Retry-After exceeds RETRY_AFTER_CAP: waiting that long would hold
+        the request thread (and any cache lock the caller holds), so the 429 is given up on.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+            else:
+                return delay if delay <= RETRY_AFTER_CAP else None
+        return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 0.1)
+
+    def _is_known_missing(self, request_key: str) -> bool:
+        """Check whether the "METHOD:endpoint" request returned 404 within the last NOT_FOUND_CACHE_TTL seconds."""
+        with self._not_found_lock:
+            expires = self._not_found.get(request_key)
+            if expires is None:
+                return False
+            if expires <= time.monotonic():
+                del self._not_found[request_key]
+                return False
+            return True
+
+    def _remember_missing(self, request_key: str) -> None:
+        """Record a 404 for the "METHOD:endpoint" request, dropping expired or oldest entries."""
+        now = time.monotonic()
+        with self._not_found_lock:
+            # Re-inserting keeps the dict ordered by expiry (every entry has the same TTL)
+            self._not_found.pop(request_key, None)
+            while self._not_found:
+                oldest_key, expires = next(iter(self._not_found.items()))
+                if expires > now and len(self._not_found) < NOT_FOUND_CACHE_MAXSIZE:
+                    break
+                del self._not_found[oldest_key]
+            self._not_found[request_key] = now + NOT_FOUND_CACHE_TTL
+
+    @staticmethod
+    def _cached_not_found(url: str) -> requests.Response:
+        """Build the 404 Response replayed for a request known to be missing."""
+        response = requests.Response()
+        response.status_code = 404
+        response.reason = "Not Found"
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = b'{"errorMessages":["Not found (cached)"],"errors":{}}'
+        return response
+
+    def clear_not_found_cache(self) -> None:
+        """Forget cached 404s (e.g. after a ticket is created)."""
+        with self._not_found_lock:
+            self._not_found.clear()
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[requests.Response]:
+        """Make a request to Jira API with error handling and retry.
+
+        4xx responses are returned for the caller to inspect (note that such a
+        Response is falsy), including 404s replayed from the not-found cache;
+        None means Jira could not be reached.
+        """
+        url = f"{self.jira_url}/rest/api/3/{endpoint}"
+        request_key = f"{method}:{endpoint}"
+        
+        if self._is_known_missing(request_key):
+            # Replay the 404 so callers still see "not found" rather than "unreachable"
+            self.logger.info("Skipping %s request to %s: recently returned 404", method, endpoint)
+            return self._cached_not_found(url)
+        
+        if orjson is not None and "json" in kwargs:
+            # Encode the body once with orjson; the session already sends Content-Type: application/json
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
         
         try:
-            response = session.request(method, url, headers=self.headers, auth=self.auth, timeout=30, **kwargs)
-            response.raise_for_status()
-            self.logger.info(f"Successful request to {endpoint}: {response.status_code}")
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                self.rate_limiter.acquire()
+                response = self.session.request(method, url, timeout=30, **kwargs)
+                self.rate_limiter.update_from_headers(response.headers)
+                if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                retry_after = self._retry_after_seconds(response, attempt)
+                if retry_after is None:
+                    self.logger.warning("Rate limited on %s, Retry-After above %.0fs: not retrying", endpoint, RETRY_AFTER_CAP)
+                    break
+                self.logger.warning("Rate limited on %s, retrying in %.1fs", endpoint, retry_after)
+                time.sleep(retry_after)
+            if response.status_code >= 400:
+                if response.status_code == 404:
+                    self._remember_missing(request_key)
+                self.logger.error("HTTP error for %s: %s - Response: %s", endpoint, response.status_code, response.text)
+                print(f"❌ HTTP error for {endpoint}: {response.status_code}")
+            else:
+                self.logger.info("Successful request to %s: %s", endpoint, response.status_code)
             return response
         except requests.exceptions.Timeout as e:
-            self.logger.error(f"Request timed out for {endpoint}: {str(e)}")
+            self.logger.error("Request timed out for %s: %s", endpoint, e)
             print(f"❌ Request timed out for {endpoint}. Please try again.")
         except requests.exceptions.ConnectionError as e:
-            self.logger.error(f"Connection error for {endpoint}: {str(e)}")
+            self.logger.error("Connection error for %s: %s", endpoint, e)
             print(f"❌ Connection error for {endpoint}. Please check your internet connection.")
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error for {endpoint}: {str(e)} - Response: {e.response.text if e.response else 'No response'}")
-            print(f"❌ HTTP error for {endpoint}: {e.response.status_code if e.response else 'No response'}")
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request error for {endpoint}: {str(e)}")
+            self.logger.error("Request error for %s: %s", endpoint, e)
             print(f"❌ Request error for {endpoint}: {e}")
         
         return None
@@ -94,96 +306,210 @@ class JiraManager:
         self.logger.info("\n🔍 Retrieving tickets...")
         print("\n🔍 Retrieving tickets...")
         
-        params = {
-            "jql": f"project = {self.project_key} ORDER BY status ASC, created DESC",
-            "fields": "summary,assignee,issuetype,priority,created,resolutiondate,status"
-        }
-        response = self._make_request("GET", "search", params=params)
-        
-        if not response:
-            return {}
+        try:
+            issues = self._search_all(self._jql_all, TICKET_FIELDS)
+            if issues is None:
+                return {}
             
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                tickets_by_status = {}
-                
-                for issue in data["issues"]:
-                    status = issue["fields"]["status"]["name"]
-                    key = issue["key"]
-                    summary = issue["fields"]["summary"]
-                    assignee = issue["fields"].get("assignee")
-                    assignee_name = assignee["displayName"] if assignee else "Unassigned"
-                    issue_type = issue["fields"]["issuetype"]["name"]
-                    priority = issue["fields"].get("priority")
-                    priority_name = priority["name"] if priority else "None"
-                    
-                    if status not in tickets_by_status:
-                        tickets_by_status[status] = []
-                    
-                    ticket_string = f"{key}: {summary} [{assignee_name}] [{issue_type}] [{priority_name}]"
-                    tickets_by_status[status].append(ticket_string)
-                
-                # Display results
-                if tickets_by_status:
-                    for status, tickets in tickets_by_status.items():
-                        self.logger.info(f"\n📌 {status} ({len(tickets)}):")
-                        print(f"\n📌 {status} ({len(tickets)}):")
-                        for ticket in tickets:
-                            self.logger.info(f"   - {ticket}")
-                            print(f"   - {ticket}")
-                else:
-                    self.logger.info(f"📋 No tickets found in project {self.project_key}")
-                    print(f"📋 No tickets found in project {self.project_key}")
-                    
-                return tickets_by_status
-                
-            except (KeyError, json.JSONDecodeError) as e:
-                self.logger.error(f"❌ Error parsing response: {e}")
-                print(f"❌ Error parsing response: {e}")
-        else:
-            self.logger.error(f"❌ Error retrieving tickets: {response.status_code} - {response.text}")
-            print(f"❌ Error retrieving tickets: {response.status_code}")
-            if response.status_code == 400:
-                self.logger.info("💡 Check your project key or JQL syntax")
-                print("💡 Check your project key or JQL syntax")
-            elif response.status_code == 401:
-                self.logger.info("💡 Check your credentials")
-                print("💡 Check your credentials")
+            tickets_by_status = self._format_tickets(issues)
+            self._ticket_cache = tickets_by_status
+            self._display_tickets(tickets_by_status)
+            return tickets_by_status
+            
+        except (KeyError, json.JSONDecodeError) as e:
+            self.logger.error("❌ Error parsing response: %s", e)
+            print(f"❌ Error parsing response: {e}")
         
         return {}
 
+    def _display_tickets(self, tickets_by_status: Dict[str, List[str]]) -> None:
+        """Print tickets grouped by status."""
+        if tickets_by_status:
+            # Build the whole listing once: one write to the terminal and one log record
+            lines = []
+            for status, tickets in tickets_by_status.items():
+                lines.append(f"\n📌 {status} ({len(tickets)}):")
+                lines.extend(f"   - {ticket}" for ticket in tickets)
+            output = "\n".join(lines)
+            sys.stdout.write(output + "\n")
+            self.logger.info(output)
+        else:
+            self.logger.info("📋 No tickets found in project %s", self.project_key)
+            print(f"📋 No tickets found in project {self.project_key}")
+
+    def render_cache(self) -> Dict[str, List[str]]:
+        """Display the locally maintained ticket list, querying Jira only if there is none yet."""
+        if self._ticket_cache is None:
+            return self.get_tickets()
+        self._display_tickets(self._ticket_cache)
+        return self._ticket_cache
+
+    def _forget_cached_ticket(self, ticket_key: str) -> Optional[tuple]:
+        """Remove a ticket from the local list, returning its (status, position) if it was there."""
+        prefix = f"{ticket_key}: "
+        for status, tickets in self._ticket_cache.items():
+            for position, ticket in enumerate(tickets):
+                if ticket.startswith(prefix):
+                    del tickets[position]
+                    if not tickets:
+                        del self._ticket_cache[status]
+                    return status, position
+        return None
+
+    def _refresh_cached_ticket(self, ticket_key: str) -> None:
+        """Re-read one ticket after a mutation and patch it into the local list."""
+        if self._ticket_cache is None:
+            return
+        response = self._make_request("GET", f"issue/{ticket_key}", params={"fields": TICKET_FIELDS})
+        try:
+            formatted = self._format_tickets([parse_json(response)]) if response else None
+        except (KeyError, json.JSONDecodeError):
+            formatted = None
+        if not formatted:
+            # Fall back to a full reload on the next display
+            self._ticket_cache = None
+            return
+        
+        status, (ticket_string,) = next(iter(formatted.items()))
+        previous = self._forget_cached_ticket(ticket_key)
+        tickets = self._ticket_cache.setdefault(status, [])
+        # Keep the ticket in place when its status did not change; otherwise list it first, like a new ticket
+        position = previous[1] if previous and previous[0] == status else 0
+        tickets.insert(position, ticket_string)
+
+    def _drop_cached_ticket(self, ticket_key: str) -> None:
+        """Remove a deleted ticket from the local list."""
+        if self._ticket_cache is not None:
+            self._forget_cached_ticket(ticket_key)
+
+    @staticmethod
+    def _format_tickets(issues: List[dict]) -> Dict[str, List[str]]:
+        """Group issues by status as "KEY: summary [assignee] [type] [priority]" strings."""
+        tickets_by_status = {}
+        
+        for issue in issues:
+            fields = issue["fields"]
+            ticket_string = TICKET_FORMAT(
+                key=issue["key"],
+                summary=fields["summary"],
+                assignee=(fields.get("assignee") or {}).get("displayName", "Unassigned"),
+                type=fields["issuetype"]["name"],
+                priority=(fields.get("priority") or {}).get("name", "None"),
+            )
+            tickets_by_status.setdefault(fields["status"]["name"], []).append(ticket_string)
+        
+        return tickets_by_status
+
+    def search_tickets(self, jql_filter: str = "") -> Optional[Dict[str, List[str]]]:
+        """Like get_tickets, optionally restricted by an extra JQL clause, without console output (None on failure)."""
+        jql = (
+            f"project = {self.project_key} AND ({jql_filter}) ORDER BY status ASC, created DESC"
+            if jql_filter else self._jql_all
+        )
+        try:
+            issues = self._search_all(jql, TICKET_FIELDS)
+            return None if issues is None else self._format_tickets(issues)
+        except (KeyError, json.JSONDecodeError) as e:
+            self.logger.error("❌ Error parsing search response: %s", e)
+            return None
+
+    def get_statuses(self) -> List[str]:
+        """Return the distinct status names used by the project's issue types."""
+        response = self._make_request("GET", f"project/{self.project_key}/statuses")
+        if not response:
+            return []
+        
+        try:
+            # dict.fromkeys keeps Jira's order while removing duplicates across issue types
+            statuses = dict.fromkeys(
+                status["name"] for issue_type in parse_json(response) for status in issue_type["statuses"]
+            )
+            return list(statuses)
+        except (KeyError, json.JSONDecodeError) as e:
+            self.logger.error("❌ Error parsing statuses: %s", e)
+            return []
+
+    def _search_page(self, jql: str, fields: str, batch_size: int, page_token: Optional[str] = None) -> Optional[dict]:
+        """Fetch one page of search results from /search/jql (None on failure)."""
+        params = {"jql": jql, "fields": fields, "maxResults": batch_size}
+        if page_token:
+            params["nextPageToken"] = page_token
+        response = self._make_request("GET", "search/jql", params=params)
+        return parse_json(response) if response else None
+
+    def _search_all(self, jql: str, fields: str, batch_size: int = SEARCH_BATCH_SIZE) -> Optional[List[dict]]:
+        """Fetch every issue matching the JQL (None if any page fails).
+
+        /search/jql pages with an opaque nextPageToken and reports no total,
+        so pages are requested one after the other until isLast.
+        """
+        issues: List[dict] = []
+        page_token = None
+        while True:
+            data = self._search_page(jql, fields, batch_size, page_token)
+            if data is None:
+                # A truncated result must not pass for the complete list (callers cache it)
+                if issues:
+                    self.logger.error("❌ Search failed after %s issues", len(issues))
+                return None
+            issues.extend(data["issues"])
+            page_token = data.get("nextPageToken")
+            if data.get("isLast", True) or not page_token:
+                return issues
+
+    def search_issues(self, jql: str, fields: str) -> Optional[List[dict]]:
+        """Run a JQL search returning only the requested fields (None on failure)."""
+        try:
+            return self._search_all(jql, fields)
+        except (KeyError, json.JSONDecodeError) as e:
+            self.logger.error("❌ Error parsing search response: %s", e)
+            return None
+
     def get_issue_types(self) -> List[str]:
-        """Retrieve available issue types for the project."""
+        """Retrieve available issue types for the project (cached for ISSUE_TYPES_CACHE_TTL seconds)."""
+        cached = self._issue_types_cache
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
         response = self._make_request("GET", f"project/{self.project_key}")
         
         if not response or response.status_code != 200:
-            self.logger.error(f"❌ Error retrieving issue types: {response.status_code if response else 'No response'}")
+            self.logger.error("❌ Error retrieving issue types: %s", response.status_code if response is not None else 'No response')
             print(f"❌ Error retrieving issue types")
             return []
         
         try:
-            data = response.json()
+            data = parse_json(response)
             issue_types = [issue_type["name"] for issue_type in data["issueTypes"] if not issue_type.get("subtask")]
-            self.logger.info(f"✅ Available issue types: {', '.join(issue_types)}")
+            self.logger.info("✅ Available issue types: %s", ', '.join(issue_types))
+            self._issue_types_cache = (issue_types, time.monotonic() + ISSUE_TYPES_CACHE_TTL)
             return issue_types
         except (KeyError, json.JSONDecodeError) as e:
-            self.logger.error(f"❌ Error parsing issue types: {e}")
+            self.logger.error("❌ Error parsing issue types: %s", e)
             print(f"❌ Error parsing issue types: {e}")
             return []
 
+    def invalidate_issue_types(self) -> None:
+        """Forget the cached issue types (e.g. after the project configuration changed)."""
+        self._issue_types_cache = None
+
     def create_ticket(self, summary: str, description: str, issue_type: str = "Task", 
-                     priority: Optional[str] = None, assignee: Optional[str] = None) -> bool:
-        """Create a new ticket with validated issue type, priority and assignee."""
+                     priority: Optional[str] = None, assignee: Optional[str] = None,
+                     validate_issue_type: bool = True) -> bool:
+        """Create a new ticket with validated issue type, priority and assignee.
+
+        Pass validate_issue_type=False when the caller has already checked the type,
+        to skip the project metadata request.
+        """
         if not summary.strip():
             self.logger.error("❌ Summary cannot be empty")
             print("❌ Summary cannot be empty")
             return False
 
         # Validate issue type
-        available_issue_types = self.get_issue_types()
-        if issue_type not in available_issue_types:
-            self.logger.error(f"❌ Invalid issue type '{issue_type}'. Available types: {', '.join(available_issue_types)}")
+        available_issue_types = self.get_issue_types() if validate_issue_type else None
+        if available_issue_types is not None and issue_type not in available_issue_types:
+            self.logger.error("❌ Invalid issue type '%s'. Available types: %s", issue_type, ', '.join(available_issue_types))
             print(f"❌ Invalid issue type '{issue_type}'. Available types: {', '.join(available_issue_types)}")
             return False
 
@@ -191,16 +517,7 @@ class JiraManager:
             "fields": {
                 "project": {"key": self.project_key},
                 "summary": summary.strip(),
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description.strip()}] if description.strip() else []
-                        }
-                    ]
-                },
+                "description": adf_document(description.strip()),
                 "issuetype": {"name": issue_type}
             }
         }
@@ -215,28 +532,31 @@ class JiraManager:
 
         response = self._make_request("POST", "issue", json=payload)
         
-        if not response:
+        if response is None:
             return False
             
         if response.status_code == 201:
+            self.clear_not_found_cache()
             try:
-                ticket_key = response.json()['key']
-                self.logger.info(f"✅ Ticket created: {ticket_key}")
+                ticket_key = parse_json(response)['key']
+                self.logger.info("✅ Ticket created: %s", ticket_key)
                 print(f"✅ Ticket created: {ticket_key}")
+                self._refresh_cached_ticket(ticket_key)
                 return True
             except (KeyError, json.JSONDecodeError) as e:
-                self.logger.error(f"❌ Error parsing response: {e}")
+                self.logger.error("❌ Error parsing response: %s", e)
                 print("✅ Ticket created successfully")
+                self._ticket_cache = None
                 return True
         else:
-            self.logger.error(f"❌ Error creating ticket: {response.status_code} - {response.text}")
+            self.logger.error("❌ Error creating ticket: %s - %s", response.status_code, response.text)
             print(f"❌ Error creating ticket: {response.status_code}")
             if response.status_code == 400:
                 try:
-                    error_data = response.json()
+                    error_data = parse_json(response)
                     if "errors" in error_data:
                         for field, error in error_data["errors"].items():
-                            self.logger.info(f"💡 {field}: {error}")
+                            self.logger.info("💡 %s: %s", field, error)
                             print(f"💡 {field}: {error}")
                 except json.JSONDecodeError:
                     pass
@@ -270,21 +590,7 @@ class JiraManager:
             # Mise à jour de la description
             if new_description:
                 # Format ADF pour Jira Cloud
-                update_fields['description'] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": new_description
-                                }
-                            ]
-                        }
-                    ]
-                }
+                update_fields['description'] = adf_document(new_description)
                 print(f"📋 Mise à jour description: {new_description[:50]}...")
             
             # Mise à jour du type de ticket
@@ -319,10 +625,11 @@ class JiraManager:
             
             if response and response.status_code == 204:
                 print(f"✅ Ticket {ticket_key} mis à jour avec succès")
+                self._refresh_cached_ticket(ticket_key)
                 return True
             else:
-                status_code = response.status_code if response else 'N/A'
-                error_msg = response.text if response else 'Aucune réponse'
+                status_code = response.status_code if response is not None else 'N/A'
+                error_msg = response.text if response is not None else 'Aucune réponse'
                 print(f"❌ Échec mise à jour ticket {ticket_key}")
                 print(f"   Status: {status_code}")
                 print(f"   Erreur: {error_msg}")
@@ -339,45 +646,51 @@ class JiraManager:
         response = self._make_request("GET", f"issue/{ticket_key}/transitions")
         
         if not response or response.status_code != 200:
-            self.logger.error(f"❌ Error getting transitions for {ticket_key}: {response.status_code if response else 'No response'}")
+            self.logger.error("❌ Error getting transitions for %s: %s", ticket_key, response.status_code if response is not None else 'No response')
             print(f"❌ Error getting transitions for {ticket_key}")
             return {}
         
         try:
-            data = response.json()
+            data = parse_json(response)
             transitions = {}
             for transition in data["transitions"]:
                 transitions[transition["name"]] = transition["id"]
-            self.logger.info(f"✅ Available transitions for {ticket_key}: {', '.join(transitions.keys())}")
+            self.logger.info("✅ Available transitions for %s: %s", ticket_key, ', '.join(transitions.keys()))
             return transitions
         except (KeyError, json.JSONDecodeError) as e:
-            self.logger.error(f"❌ Error parsing transitions: {e}")
+            self.logger.error("❌ Error parsing transitions: %s", e)
             print("❌ Error parsing transitions")
             return {}
 
-    def transition_ticket(self, ticket_key: str, transition_name: Optional[str] = None, comment: Optional[str] = None) -> bool:
-        """Transition a ticket to a new status, with optional comment for 'Terminé' transitions."""
+    def transition_ticket(self, ticket_key: str, transition_name: Optional[str] = None, comment: Optional[str] = None,
+                          transitions: Optional[Dict[str, str]] = None) -> bool:
+        """Transition a ticket to a new status, adding the optional comment in the same request.
+
+        Pass transitions when the caller has already fetched them, to skip the lookup.
+        """
         if not ticket_key.strip():
             self.logger.error("❌ Ticket key cannot be empty")
             print("❌ Ticket key cannot be empty")
             return False
 
         # Get available transitions
-        transitions = self.get_available_transitions(ticket_key)
+        if transitions is None:
+            transitions = self.get_available_transitions(ticket_key)
         
         if not transitions:
             return False
 
         # If no specific transition provided, show available options
         if not transition_name:
+            names = tuple(transitions)
             print(f"\n🔄 Available transitions for {ticket_key}:")
-            for i, (name, trans_id) in enumerate(transitions.items(), 1):
+            for i, name in enumerate(names, 1):
                 print(f"{i}. {name}")
             
             try:
                 choice = int(input("\nChoose transition (number): ")) - 1
-                if 0 <= choice < len(transitions):
-                    transition_name = list(transitions.keys())[choice]
+                if 0 <= choice < len(names):
+                    transition_name = names[choice]
                 else:
                     self.logger.error("❌ Invalid choice")
                     print("❌ Invalid choice")
@@ -389,61 +702,82 @@ class JiraManager:
 
         # Check if transition exists
         if transition_name not in transitions:
-            self.logger.error(f"❌ Transition '{transition_name}' not available")
+            self.logger.error("❌ Transition '%s' not available", transition_name)
             print(f"❌ Transition '{transition_name}' not available")
             print(f"💡 Available transitions: {', '.join(transitions.keys())}")
             return False
 
-        # Add comment if transitioning to 'Terminé' and comment provided
-        if 'terminé' in transition_name.lower() and comment and comment.strip():
-            comment_payload = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": comment.strip()}]
-                        }
-                    ]
-                }
-            }
-            comment_response = self._make_request("POST", f"issue/{ticket_key}/comment", json=comment_payload)
-            if not comment_response or comment_response.status_code != 201:
-                self.logger.error(f"❌ Error adding comment: {comment_response.status_code if comment_response else 'No response'} - {comment_response.text if comment_response else ''}")
-                print(f"❌ Error adding comment: {comment_response.status_code if comment_response else 'No response'}")
-                return False
-            self.logger.info("✅ Comment added successfully")
-            print("✅ Comment added successfully")
-
-        # Perform transition
+        # Perform transition, attaching the comment to the same call when provided
         payload = {
             "transition": {
                 "id": transitions[transition_name]
             }
         }
+        if comment and comment.strip():
+            payload["update"] = {"comment": [{"add": {"body": adf_document(comment.strip())}}]}
 
         response = self._make_request("POST", f"issue/{ticket_key}/transitions", json=payload)
         
-        if not response:
+        if response is None:
             return False
             
         if response.status_code == 204:
-            self.logger.info(f"✅ Ticket {ticket_key} transitioned to '{transition_name}' successfully")
+            self.logger.info("✅ Ticket %s transitioned to '%s' successfully", ticket_key, transition_name)
             print(f"✅ Ticket {ticket_key} transitioned to '{transition_name}' successfully")
+            self._refresh_cached_ticket(ticket_key)
             return True
         else:
-            self.logger.error(f"❌ Error transitioning ticket: {response.status_code} - {response.text}")
+            self.logger.error("❌ Error transitioning ticket: %s - %s", response.status_code, response.text)
             print(f"❌ Error transitioning ticket: {response.status_code}")
             if response.status_code == 400:
                 self.logger.info("💡 Check if the transition is valid for current status")
                 print("💡 Check if the transition is valid for current status")
             elif response.status_code == 404:
-                self.logger.info(f"💡 Ticket {ticket_key} not found")
+                self.logger.info("💡 Ticket %s not found", ticket_key)
                 print(f"💡 Ticket {ticket_key} not found")
         
         return False
 
+    def transition_tickets(self, ticket_keys: List[str], transition_name: str,
+                           comment: Optional[str] = None) -> Dict[str, bool]:
+        """Apply the same transition to several tickets concurrently; returns {ticket key: success}.
+
+        Transition ids depend on each ticket's workflow and current status, so every
+        worker looks up its ticket's transitions before posting.
+        """
+        keys = list(dict.fromkeys(key.strip() for key in ticket_keys if key.strip()))
+        if not keys:
+            return {}
+        
+        update = None
+        if comment and comment.strip():
+            update = {"comment": [{"add": {"body": adf_document(comment.strip())}}]}
+        
+        def transition(ticket_key: str) -> bool:
+            transition_id = self.get_available_transitions(ticket_key).get(transition_name)
+            if transition_id is None:
+                self.logger.error("❌ Transition '%s' not available for %s", transition_name, ticket_key)
+                return False
+            payload = {"transition": {"id": transition_id}}
+            if update:
+                payload["update"] = update
+            response = self._make_request("POST", f"issue/{ticket_key}/transitions", json=payload)
+            return response is not None and response.status_code == 204
+        
+        with ThreadPoolExecutor(max_workers=min(BULK_TRANSITION_WORKERS, len(keys))) as pool:
+            results = dict(zip(keys, pool.map(transition, keys)))
+        
+        succeeded = sum(results.values())
+        failed = [key for key, ok in results.items() if not ok]
+        self.logger.info("✅ %s/%s tickets transitioned to '%s'", succeeded, len(keys), transition_name)
+        print(f"✅ {succeeded}/{len(keys)} tickets transitioned to '{transition_name}'")
+        if failed:
+            print(f"❌ Failed: {', '.join(failed)}")
+        if succeeded:
+            # One search on the next display is cheaper than re-reading every ticket
+            self._ticket_cache = None
+        return results
+
     def delete_ticket(self, ticket_key: str) -> bool:
         """Delete a ticket."""
         if not ticket_key.strip():
@@ -460,18 +794,19 @@ class JiraManager:
 
         response = self._make_request("DELETE", f"issue/{ticket_key}")
         
-        if not response:
+        if response is None:
             return False
             
         if response.status_code == 204:
-            self.logger.info(f"✅ Ticket {ticket_key} deleted successfully")
+            self.logger.info("✅ Ticket %s deleted successfully", ticket_key)
             print(f"✅ Ticket {ticket_key} deleted successfully")
+            self._drop_cached_ticket(ticket_key)
             return True
         else:
-            self.logger.error(f"❌ Error deleting ticket: {response.status_code} - {response.text}")
+            self.logger.error("❌ Error deleting ticket: %s - %s", response.status_code, response.text)
             print(f"❌ Error deleting ticket: {response.status_code}")
             if response.status_code == 404:
-                self.logger.info(f"💡 Ticket {ticket_key} not found")
+                self.logger.info("💡 Ticket %s not found", ticket_key)
                 print(f"💡 Ticket {ticket_key} not found")
             elif response.status_code == 403:
                 self.logger.info("💡 You don't have permission to delete this ticket")
@@ -487,6 +822,21 @@ def get_non_empty_input(prompt: str) -> str:
             return value
         print("❌ This field cannot be empty. Please try again.")
 
+# Main menu, composed once and printed with a single write per loop
+MENU_BANNER = "\n".join([
+    "\n" + "=" * 40,
+    "📌 Jira API Manager",
+    "=" * 40,
+    "1. 📋 List tickets",
+    "2. ➕ Create ticket",
+    "3. ✏️  Modify ticket",
+    "4. 🔄 Change ticket status",
+    "5. 🗑️  Delete ticket",
+    "6. 🔁 Change status of several tickets",
+    "0. 👋 Exit",
+    "=" * 40,
+])
+
 def menu():
     """Interactive menu for Jira operations."""
     print("🚀 Initializing Jira Manager...")
@@ -500,16 +850,7 @@ def menu():
         return
 
     while True:
-        print("\n" + "="*40)
-        print("📌 Jira API Manager")
-        print("="*40)
-        print("1. 📋 List tickets")
-        print("2. ➕ Create ticket")
-        print("3. ✏️  Modify ticket")
-        print("4. 🔄 Change ticket status")
-        print("5. 🗑️  Delete ticket")
-        print("0. 👋 Exit")
-        print("="*40)
+        print(MENU_BANNER)
         
         choice = input("Choose an option: ").strip()
         
@@ -525,7 +866,7 @@ def menu():
                 
                 if jira.create_ticket(summary, description, issue_type):
                     print("\n📋 Updated ticket list:")
-                    jira.get_tickets()
+                    jira.render_cache()
                     
             elif choice == "3":
                 print("\n✏️  Modifying ticket...")
@@ -536,7 +877,7 @@ def menu():
                 
                 if jira.update_ticket(ticket_key, new_summary, new_description, new_issue_type):
                     print("\n📋 Updated ticket list:")
-                    jira.get_tickets()
+                    jira.render_cache()
                     
             elif choice == "4":
                 print("\n🔄 Changing ticket status...")
@@ -546,29 +887,31 @@ def menu():
                 if not transitions:
                     continue
                 # Show transitions and get user choice
+                names = tuple(transitions)
+                done_names = frozenset(name for name in names if DONE_TRANSITION_RE.search(name))
                 print(f"\n🔄 Available transitions for {ticket_key}:")
-                for i, (name, trans_id) in enumerate(transitions.items(), 1):
+                for i, name in enumerate(names, 1):
                     print(f"{i}. {name}")
                 try:
                     choice = int(input("\nChoose transition (number): ")) - 1
-                    if 0 <= choice < len(transitions):
-                        transition_name = list(transitions.keys())[choice]
+                    if 0 <= choice < len(names):
+                        transition_name = names[choice]
                     else:
-                        self.logger.error("❌ Invalid choice")
+                        jira.logger.error("❌ Invalid choice")
                         print("❌ Invalid choice")
                         continue
                 except (ValueError, IndexError):
-                    self.logger.error("❌ Invalid input")
+                    jira.logger.error("❌ Invalid input")
                     print("❌ Invalid input")
                     continue
-                # Ask for comment if transitioning to 'Terminé'
+                # Ask for comment if transitioning to a closing status ('Terminé', 'Done'...)
                 comment = None
-                if 'terminé' in transition_name.lower():
+                if transition_name in done_names:
                     comment = input("Comment for termination (optional): ").strip() or None
                 
-                if jira.transition_ticket(ticket_key, transition_name, comment):
+                if jira.transition_ticket(ticket_key, transition_name, comment, transitions=transitions):
                     print("\n📋 Updated ticket list:")
-                    jira.get_tickets()
+                    jira.render_cache()
                     
             elif choice == "5":
                 print("\n🗑️  Deleting ticket...")
@@ -576,7 +919,19 @@ def menu():
                 
                 if jira.delete_ticket(ticket_key):
                     print("\n📋 Updated ticket list:")
-                    jira.get_tickets()
+                    jira.render_cache()
+                    
+            elif choice == "6":
+                print("\n🔁 Changing status of several tickets...")
+                ticket_keys = get_non_empty_input("Ticket keys (comma-separated): ").split(",")
+                transition_name = get_non_empty_input("Transition name: ")
+                comment = None
+                if DONE_TRANSITION_RE.search(transition_name):
+                    comment = input("Comment for termination (optional): ").strip() or None
+                
+                if any(jira.transition_tickets(ticket_keys, transition_name, comment).values()):
+                    print("\n📋 Updated ticket list:")
+                    jira.render_cache()
                     
             elif choice == "0":
                 print("👋 Goodbye!")
@@ -589,7 +944,7 @@ def menu():
             print("\n👋 Goodbye!")
             break
         except Exception as e:
-            self.logger.error(f"❌ Unexpected error: {e}")
+            jira.logger.error("❌ Unexpected error: %s", e)
             print(f"❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée WSGI de Jira Manager Pro pour un serveur de production.
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+from api import app
+
+application = app